@@ -0,0 +1,207 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+import base64
+import binascii
+from app.models.AuditLog import AuditLog
+from app.models.User import User
+from app.utils.audit_writer import audit_writer
+
+
+def create_audit_log(
+    db: Session,
+    user_id: Optional[int],
+    action: str,
+    entity_type: str,
+    entity_id: Optional[int] = None,
+    cart_id: Optional[int] = None,
+    details: Optional[Dict[str, Any]] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    username: Optional[str] = None
+) -> AuditLog:
+    """
+    Create an audit log entry and commit it immediately.
+    Prefer queue_audit_log on request paths.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user performing the action
+        action: Action performed (ADD, UPDATE, DELETE, VIEW, CLEAR)
+        entity_type: Type of entity (CART_ITEM, CART)
+        entity_id: ID of the entity (cart_item_id)
+        cart_id: ID of the cart (if applicable)
+        details: Additional details as dictionary
+        ip_address: User's IP address
+        user_agent: User's browser/device info
+        username: Display name of the user; looked up from user_id when omitted
+    """
+    if username is None and user_id:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user:
+            username = user.name or user.mobile
+
+    audit_log = AuditLog(
+        user_id=user_id,
+        username=username,
+        cart_id=cart_id,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        details=details,
+        ip_address=ip_address,
+        user_agent=user_agent
+    )
+    
+    db.add(audit_log)
+    db.commit()
+    db.refresh(audit_log)
+    
+    return audit_log
+
+
+def queue_audit_log(
+    user: Optional[User],
+    action: str,
+    entity_type: str,
+    entity_id: Optional[int] = None,
+    cart_id: Optional[int] = None,
+    details: Optional[Dict[str, Any]] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None
+):
+    """
+    Queue an audit log entry for the background audit writer.
+    The username is taken from the already-loaded user, so no extra query is made.
+    """
+    audit_writer.submit(AuditLog, {
+        "user_id": user.id if user else None,
+        "username": (user.name or user.mobile) if user else None,
+        "cart_id": cart_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "details": details,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "created_at": datetime.utcnow()
+    })
+
+
+def encode_cursor(log: AuditLog) -> str:
+    """
+    Opaque keyset cursor for the position after `log`: its (created_at, id).
+    """
+    raw = f"{log.created_at.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Inverse of encode_cursor. Raises ValueError for a malformed cursor.
+    """
+    try:
+        created_at, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _filtered_query(
+    db: Session,
+    user_id: Optional[int] = None,
+    cart_id: Optional[int] = None,
+    action: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None
+):
+    query = db.query(AuditLog)
+    if user_id is not None:
+        query = query.filter(AuditLog.user_id == user_id)
+    if cart_id is not None:
+        query = query.filter(AuditLog.cart_id == cart_id)
+    if action:
+        query = query.filter(AuditLog.action == action)
+    if entity_type:
+        query = query.filter(AuditLog.entity_type == entity_type)
+    if created_from:
+        query = query.filter(AuditLog.created_at >= created_from)
+    if created_to:
+        query = query.filter(AuditLog.created_at < created_to)
+    if cursor:
+        created_at, log_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            AuditLog.created_at < created_at,
+            and_(AuditLog.created_at == created_at, AuditLog.id < log_id)
+        ))
+    # Newest first; matches the (user_id|cart_id, created_at, id) indexes
+    return query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+
+
+def _page(query, limit: int) -> Tuple[List[AuditLog], Optional[str]]:
+    # Fetch one extra row to know whether there is a next page
+    logs = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_cursor = encode_cursor(logs[-1])
+    return logs, next_cursor
+
+
+def get_audit_logs_by_user(
+    db: Session,
+    user_id: int,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    **filters
+) -> Tuple[List[AuditLog], Optional[str]]:
+    """
+    Retrieve one page of audit logs for a user, newest first (keyset pagination).
+
+    Args:
+        db: Database session
+        user_id: ID of the user
+        limit: Page size
+        cursor: next_cursor of the previous page (None for the first page)
+        filters: action, entity_type, created_from, created_to
+
+    Returns the page and the cursor for the next page (None when this is the last page).
+    Raises ValueError for a malformed cursor.
+    """
+    return _page(_filtered_query(db, user_id=user_id, cursor=cursor, **filters), limit)
+
+
+def get_audit_logs_by_cart(
+    db: Session,
+    cart_id: int,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    **filters
+) -> Tuple[List[AuditLog], Optional[str]]:
+    """
+    Retrieve one page of audit logs for a cart, newest first. See get_audit_logs_by_user.
+    """
+    return _page(_filtered_query(db, cart_id=cart_id, cursor=cursor, **filters), limit)
+
+
+def iter_audit_log_chunks(
+    db: Session,
+    user_id: int,
+    chunk_size: int = 500,
+    **filters
+) -> Iterator[List[AuditLog]]:
+    """
+    Yield every matching audit log for a user in chunks of `chunk_size`, newest first.
+    Each chunk is a separate keyset query, so memory stays bounded and no
+    cursor is held open between chunks.
+    """
+    cursor = None
+    while True:
+        logs, cursor = get_audit_logs_by_user(db, user_id, limit=chunk_size, cursor=cursor, **filters)
+        if logs:
+            yield logs
+        if cursor is None:
+            return
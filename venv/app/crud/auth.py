@@ -0,0 +1,228 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+import secrets
+from typing import Optional
+from app.models.User import User
+from app.models.device_session import DeviceSession
+from app.crud import otp_log
+from app.schemas.auth import AuthenticatedUser
+from app.utils.principal_cache import invalidate_session, invalidate_user, set_principal
+
+
+def get_user_by_mobile(db: Session, mobile: str) -> Optional[User]:
+    """
+    Retrieve user by mobile number.
+    """
+    return db.query(User).filter(User.mobile == mobile).first()
+
+
+def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+    """
+    Retrieve user by ID.
+    """
+    return db.query(User).filter(User.id == user_id).first()
+
+
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """
+    Retrieve user by email.
+    """
+    return db.query(User).filter(User.email == email).first()
+
+
+def create_user(db: Session, mobile: str, name: Optional[str] = None, email: Optional[str] = None) -> User:
+    """
+    Create a new user with mobile number.
+    """
+    user = User(mobile=mobile, name=name, email=email)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def upsert_user_by_mobile(db: Session, mobile: str) -> User:
+    """
+    Get the user with this mobile number, creating it if needed.
+    Flushes but does not commit, the caller owns the transaction.
+    """
+    user = get_user_by_mobile(db, mobile)
+    if user:
+        return user
+
+    try:
+        with db.begin_nested():
+            user = User(mobile=mobile, is_active=True)
+            db.add(user)
+    except IntegrityError:
+        # Created concurrently by another login for the same number. Use a locking
+        # read: a plain SELECT reuses this transaction's snapshot (REPEATABLE READ
+        # on InnoDB), which still has no such user.
+        user = db.query(User).filter(User.mobile == mobile).with_for_update().first()
+        if user is None:
+            raise
+    return user
+
+
+def update_user_profile(
+    db: Session,
+    user_id: int,
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    mobile: Optional[str] = None
+) -> Optional[User]:
+    """
+    Update user profile information.
+    Only updates fields that are provided (not None).
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return None
+
+    # Update only provided fields
+    if name is not None:
+        user.name = name
+    if email is not None:
+        user.email = email
+    if mobile is not None:
+        user.mobile = mobile
+
+    try:
+        db.commit()
+        db.refresh(user)
+        invalidate_user(user_id)
+        return user
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def deactivate_user(db: Session, user_id: int) -> bool:
+    """
+    Deactivate a user account.
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        user.is_active = False
+        db.commit()
+        invalidate_user(user_id)
+        return True
+    return False
+
+
+def create_device_session(
+    db: Session,
+    user_id: int,
+    device_id: Optional[str] = None,
+    device_platform: Optional[str] = None,
+    device_details: Optional[str] = None,
+    ip: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    expires_in_seconds: Optional[int] = None
+) -> DeviceSession:
+    """
+    Create a new device session for a user.
+    """
+    session_key = secrets.token_urlsafe(32)
+    expires_at = datetime.utcnow() + timedelta(seconds=expires_in_seconds) if expires_in_seconds else None
+
+    ds = DeviceSession(
+        user_id=user_id,
+        session_key=session_key,
+        device_id=device_id,
+        device_platform=device_platform,
+        device_details=device_details,
+        ip_address=ip,
+        user_agent=user_agent,
+        expires_at=expires_at,
+        is_active=True
+    )
+    db.add(ds)
+    db.commit()
+    db.refresh(ds)
+    return ds
+
+
+def login_with_verified_otp(
+    db: Session,
+    mobile: str,
+    phone_number: str,
+    sent_log_id: Optional[int],
+    user_entered_otp_hash: str,
+    device_id: Optional[str] = None,
+    device_platform: Optional[str] = None,
+    device_details: Optional[str] = None,
+    ip: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    expires_in_seconds: Optional[int] = None
+) -> AuthenticatedUser:
+    """
+    Complete an OTP login in one transaction:
+    mark the sent OTP log verified, get or create the user and open a device session.
+
+    sent_log_id is the OTPLog id stored with the OTP. When it is missing the
+    latest "sent" log for the phone number is used instead.
+    The returned principal is also put in the principal cache.
+    """
+    if sent_log_id is None:
+        sent_log_id = otp_log.get_latest_sent_log_id(db, phone_number)
+    if sent_log_id is not None:
+        otp_log.set_verified(db, sent_log_id, user_entered_otp_hash)
+
+    user = upsert_user_by_mobile(db, mobile)
+
+    expires_at = datetime.utcnow() + timedelta(seconds=expires_in_seconds) if expires_in_seconds else None
+    ds = DeviceSession(
+        user_id=user.id,
+        session_key=secrets.token_urlsafe(32),
+        device_id=device_id,
+        device_platform=device_platform,
+        device_details=device_details,
+        ip_address=ip,
+        user_agent=user_agent,
+        expires_at=expires_at,
+        is_active=True
+    )
+    db.add(ds)
+    db.flush()
+
+    # Read everything needed before commit expires the loaded attributes
+    principal = AuthenticatedUser(
+        id=user.id,
+        name=user.name,
+        mobile=user.mobile,
+        email=user.email,
+        is_active=bool(user.is_active),
+        session_id=ds.id,
+        session_expires_at=expires_at
+    )
+
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    set_principal(principal)
+    return principal
+
+
+def get_device_session(db: Session, session_id: int) -> Optional[DeviceSession]:
+    """
+    Retrieve device session by ID.
+    """
+    return db.query(DeviceSession).filter(DeviceSession.id == session_id).first()
+
+
+def deactivate_session(db: Session, session_id: int) -> bool:
+    """
+    Deactivate a device session.
+    """
+    session = db.query(DeviceSession).filter(DeviceSession.id == session_id).first()
+    if session:
+        session.is_active = False
+        db.commit()
+        invalidate_session(session.user_id, session_id)
+        return True
+    return False
\ No newline at end of file
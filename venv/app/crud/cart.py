@@ -0,0 +1,265 @@
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
+from dotenv import load_dotenv
+import os
+
+from app.models.CartItemModel import CartItem
+from app.models.ProductModel import Product
+from app.utils.cache import TTLCache
+
+load_dotenv()
+
+# The cart cache is per process and invalidation does not reach other workers,
+# so it is off by default when several are configured (WEB_CONCURRENCY, as read
+# by uvicorn and gunicorn). CART_CACHE_TTL_SECONDS=0 turns it off explicitly.
+_WORKERS = int(os.getenv("WEB_CONCURRENCY", 1))
+CART_CACHE_TTL_SECONDS = float(os.getenv("CART_CACHE_TTL_SECONDS", 60 if _WORKERS <= 1 else 0))
+CART_CACHE_MAX_SIZE = int(os.getenv("CART_CACHE_MAX_SIZE", 10000))
+CART_CACHE_ENABLED = CART_CACHE_TTL_SECONDS > 0
+
+DELIVERY_CHARGE = 50
+
+# Per-user cart view cache, invalidated by every cart mutation
+cart_cache = TTLCache(max_size=CART_CACHE_MAX_SIZE, ttl=CART_CACHE_TTL_SECONDS)
+
+
+def get_cart_items_with_products(db: Session, user_id: int) -> List[Tuple[CartItem, Product]]:
+    """
+    Retrieve a user's cart items together with their products in one joined query.
+    """
+    return (
+        db.query(CartItem, Product)
+        .join(Product, CartItem.product_id == Product.ProductId)
+        .filter(CartItem.user_id == user_id)
+        .order_by(CartItem.id)
+        .all()
+    )
+
+
+def build_cart_view(db: Session, user_id: int) -> Dict[str, Any]:
+    """
+    Build the cart summary and line items for a user in a single pass.
+    cart_summary is None when the cart is empty.
+    """
+    rows = get_cart_items_with_products(db, user_id)
+
+    subtotal_amount = 0
+    cart_item_details = []
+
+    for item, product in rows:
+        total = item.quantity * product.SpecialPrice
+        subtotal_amount += total
+
+        cart_item_details.append({
+            "cart_item_id": item.id,
+            "product_id": product.ProductId,
+            "product_name": product.Name,
+            "product_images": product.Images,
+            "price": product.Price,
+            "special_price": product.SpecialPrice,
+            "quantity": item.quantity,
+            "total_amount": total
+        })
+
+    summary: Optional[Dict[str, Any]] = None
+    if cart_item_details:
+        summary = {
+            "total_items": len(cart_item_details),
+            "subtotal_amount": subtotal_amount,
+            "delivery_charge": DELIVERY_CHARGE,
+            "grand_total": subtotal_amount + DELIVERY_CHARGE
+        }
+
+    return {
+        "cart_summary": summary,
+        "cart_items": cart_item_details
+    }
+
+
+def get_cart_view(db: Session, user_id: int) -> Dict[str, Any]:
+    """
+    Cached version of build_cart_view.
+    """
+    if not CART_CACHE_ENABLED:
+        return build_cart_view(db, user_id)
+    return cart_cache.get_or_set(user_id, lambda: build_cart_view(db, user_id))
+
+
+def invalidate_cart(user_id: int):
+    """
+    Drop the cached cart view for a user. Call after any cart change is committed.
+    """
+    cart_cache.delete(user_id)
+
+
+def find_missing_products(db: Session, product_ids: Iterable[int]) -> Set[int]:
+    """
+    Return the ids in product_ids that do not exist, using one IN query.
+    """
+    wanted = set(product_ids)
+    if not wanted:
+        return set()
+    found = db.query(Product.ProductId).filter(Product.ProductId.in_(wanted)).all()
+    return wanted - {row.ProductId for row in found}
+
+
+def _fold_operations(operations) -> Dict[int, Tuple[str, int]]:
+    """
+    Reduce an ordered list of add/set/remove operations to one net change per product:
+    ("add", n) adds n to the current quantity, ("set", n) replaces it, ("remove", 0) deletes it.
+    """
+    net: Dict[int, Tuple[str, int]] = {}
+    for operation in operations:
+        current = net.get(operation.product_id)
+        if operation.removes:
+            net[operation.product_id] = ("remove", 0)
+        elif operation.op == "set":
+            net[operation.product_id] = ("set", operation.quantity)
+        elif current is None:
+            net[operation.product_id] = ("add", operation.quantity)
+        elif current[0] == "remove":
+            net[operation.product_id] = ("set", operation.quantity)
+        else:
+            net[operation.product_id] = (current[0], current[1] + operation.quantity)
+    return net
+
+
+def get_cart_lines(db: Session, user_id: int, product_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+    """
+    Current (cart_item_id, quantity) per product for the given products, using one IN query.
+    Products not in the cart are left out.
+    """
+    wanted = set(product_ids)
+    if not wanted:
+        return {}
+    rows = db.query(CartItem.id, CartItem.product_id, CartItem.quantity).filter(
+        CartItem.user_id == user_id,
+        CartItem.product_id.in_(wanted)
+    ).all()
+    return {row.product_id: (row.id, row.quantity) for row in rows}
+
+
+def _mysql_upsert(rows: List[Dict[str, int]], increment: bool):
+    stmt = mysql.insert(CartItem).values(rows)
+    new_quantity = stmt.inserted.quantity
+    return stmt.on_duplicate_key_update(
+        quantity=CartItem.quantity + new_quantity if increment else new_quantity,
+        updated_at=func.now()
+    )
+
+
+def _sqlite_upsert(rows: List[Dict[str, int]], increment: bool):
+    stmt = sqlite.insert(CartItem).values(rows)
+    new_quantity = stmt.excluded.quantity
+    return stmt.on_conflict_do_update(
+        index_elements=[CartItem.user_id, CartItem.product_id],
+        set_={
+            "quantity": CartItem.quantity + new_quantity if increment else new_quantity,
+            "updated_at": func.now()
+        }
+    )
+
+
+# Single-statement upserts by dialect name; other databases use the portable path
+UPSERT_STATEMENTS = {
+    "mysql": _mysql_upsert,
+    "sqlite": _sqlite_upsert,
+}
+
+
+def _upsert_quantities(
+    db: Session,
+    user_id: int,
+    quantities: Dict[int, int],
+    increment: bool,
+    existing: Dict[int, Tuple[int, int]]
+):
+    """
+    Insert cart rows or update the quantity of existing ones, in a single statement
+    where the dialect supports it. increment=True adds to the stored quantity,
+    otherwise it is replaced. existing is the get_cart_lines result for these products.
+    """
+    rows = [
+        {"user_id": user_id, "product_id": product_id, "quantity": quantity}
+        for product_id, quantity in quantities.items()
+    ]
+
+    build_upsert = UPSERT_STATEMENTS.get(db.get_bind().dialect.name)
+    if build_upsert is not None:
+        db.execute(build_upsert(rows, increment))
+        return
+
+    # Portable fallback: update the lines already in the cart, insert the rest
+    new_rows = []
+    for row in rows:
+        line = existing.get(row["product_id"])
+        if line is None:
+            new_rows.append(row)
+            continue
+        db.execute(
+            update(CartItem)
+            .where(CartItem.id == line[0])
+            .values(
+                quantity=CartItem.quantity + row["quantity"] if increment else row["quantity"],
+                updated_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+    if new_rows:
+        db.execute(insert(CartItem), new_rows)
+
+
+def apply_cart_operations(
+    db: Session,
+    user_id: int,
+    operations
+) -> Tuple[Dict[int, Tuple[str, int]], Dict[int, Tuple[int, int]]]:
+    """
+    Apply add/set/remove operations to a user's cart and commit.
+
+    Operations are folded into one net change per product, then written with
+    one DELETE for removals and one upsert each for added and set quantities.
+    Product ids must already be validated (see find_missing_products).
+    Returns the net change applied per product and the (cart_item_id, quantity)
+    each touched product had before, as read by get_cart_lines.
+    """
+    net = _fold_operations(operations)
+
+    removed = [product_id for product_id, (op, _) in net.items() if op == "remove"]
+    added = {product_id: qty for product_id, (op, qty) in net.items() if op == "add"}
+    replaced = {product_id: qty for product_id, (op, qty) in net.items() if op == "set"}
+
+    try:
+        previous = get_cart_lines(db, user_id, net)
+        if removed:
+            db.execute(
+                delete(CartItem)
+                .where(CartItem.user_id == user_id, CartItem.product_id.in_(removed))
+                .execution_options(synchronize_session=False)
+            )
+        if added:
+            _upsert_quantities(db, user_id, added, increment=True, existing=previous)
+        if replaced:
+            _upsert_quantities(db, user_id, replaced, increment=False, existing=previous)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    # The Core statements bypass the identity map; with expire_on_commit=False
+    # (AsyncSessionLocal) already loaded CartItems would otherwise keep old quantities
+    db.expire_all()
+    invalidate_cart(user_id)
+    return net, previous
+
+
+def refresh_cart_view(db: Session, user_id: int) -> Dict[str, Any]:
+    """
+    Rebuild a user's cart view and store it in the cart cache.
+    """
+    cart = build_cart_view(db, user_id)
+    if CART_CACHE_ENABLED:
+        cart_cache.set(user_id, cart)
+    return cart
@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+from datetime import datetime
+from app.models.otp_log import OTPLog
+from app.utils.security import hash_value  # Use central hashing function
+
+
+def create_sent_log(db: Session, phone_number: str, otp_hash: str):
+    """
+    Create log when OTP is generated & sent.
+    otp_hash must already be hashed before passed.
+    """
+    log = OTPLog(
+        phone_number=phone_number,
+        hashed_otp=otp_hash,
+        status="sent"
+    )
+    db.add(log)
+    db.commit()
+    db.refresh(log)
+    return log
+
+
+def mark_verified(db: Session, log_id: int, user_entered_otp_hash: str):
+    """
+    Mark the previously sent OTP as verified successfully.
+    Store the hashed OTP provided by user for auditing.
+    """
+    log = db.query(OTPLog).filter(OTPLog.id == log_id).first()
+    if log:
+        log.user_entered_otp = user_entered_otp_hash
+        log.verified_at = datetime.utcnow()
+        log.status = "verified"
+        db.commit()
+        db.refresh(log)
+    return log
+
+
+def set_verified(db: Session, log_id: int, user_entered_otp_hash: str) -> bool:
+    """
+    Mark a sent OTP log as verified with a single UPDATE.
+    Does not commit, the caller owns the transaction.
+    """
+    updated = db.query(OTPLog).filter(OTPLog.id == log_id).update(
+        {
+            OTPLog.user_entered_otp: user_entered_otp_hash,
+            OTPLog.verified_at: datetime.utcnow(),
+            OTPLog.status: "verified"
+        },
+        synchronize_session=False
+    )
+    return updated > 0
+
+
+def get_latest_sent_log_id(db: Session, phone_number: str):
+    """
+    ID of the most recent OTP log still in "sent" status for a phone number.
+    """
+    row = (
+        db.query(OTPLog.id)
+        .filter(OTPLog.phone_number == phone_number, OTPLog.status == "sent")
+        .order_by(OTPLog.generated_at.desc())
+        .first()
+    )
+    return row.id if row else None
+
+
+def mark_failed(db: Session, phone_number: str, user_entered_otp_hash: str):
+    """
+    Log failed OTP attempts.
+    hashed_otp is preserved as 'N/A' because we don't know which OTP was expected.
+    """
+    log = OTPLog(
+        phone_number=phone_number,
+        hashed_otp="N/A",
+        user_entered_otp=user_entered_otp_hash,
+        verified_at=datetime.utcnow(),
+        status="failed"
+    )
+    db.add(log)
+    db.commit()
+    db.refresh(log)
+    return log
\ No newline at end of file
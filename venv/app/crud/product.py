@@ -0,0 +1,69 @@
+from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, List, Tuple
+from app.models.ProductModel import Product
+
+# Columns returned by the lightweight listing (no Description)
+SUMMARY_COLUMNS = (
+    Product.ProductId,
+    Product.Name,
+    Product.Price,
+    Product.SpecialPrice,
+    Product.ShortDescription,
+    Product.Discount,
+    Product.Images,
+)
+
+FULL_COLUMNS = SUMMARY_COLUMNS + (Product.Description,)
+
+
+def list_products(
+    db: Session,
+    limit: int,
+    cursor: Optional[int] = None,
+    fields: str = "full"
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Retrieve one page of products ordered by ProductId (keyset pagination).
+
+    Args:
+        db: Database session
+        limit: Page size
+        cursor: Last ProductId of the previous page (None for the first page)
+        fields: "full" for every column, "summary" to leave out Description
+
+    Returns the page as plain dicts and the cursor for the next page
+    (None when this is the last page).
+    """
+    columns = SUMMARY_COLUMNS if fields == "summary" else FULL_COLUMNS
+
+    query = db.query(*columns)
+    if cursor is not None:
+        query = query.filter(Product.ProductId > cursor)
+
+    # Fetch one extra row to know whether there is a next page
+    rows = query.order_by(Product.ProductId).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].ProductId
+
+    return [dict(row._mapping) for row in rows], next_cursor
+
+
+def get_product(db: Session, product_id: int) -> Optional[Product]:
+    """
+    Retrieve product by ProductId.
+    """
+    return db.query(Product).filter(Product.ProductId == product_id).first()
+
+
+def create_product(db: Session, values: Dict[str, Any]) -> Product:
+    """
+    Create a new product.
+    """
+    product = Product(**values)
+    db.add(product)
+    db.commit()
+    db.refresh(product)
+    return product
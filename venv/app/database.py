@@ -0,0 +1,96 @@
+import os
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, declarative_base
+from dotenv import load_dotenv
+
+# Define path to .env
+ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+
+# Load environment variables
+load_dotenv(ENV_PATH)
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if not DATABASE_URL:
+    raise ValueError(f"DATABASE_URL is not set in {ENV_PATH}")
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+# SQL logging is expensive, keep it off unless explicitly asked for
+DB_ECHO = _env_flag("DB_ECHO")
+
+# Connection pool (ignored for SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", True)
+
+# Async engine / AsyncSession path, used by the async cart, product and auth routes
+USE_ASYNC_DB = _env_flag("USE_ASYNC_DB")
+
+# Async driver for each sync driver we support
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _engine_options(url: str) -> dict:
+    options = {"echo": DB_ECHO}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    return options
+
+
+def _async_database_url(url: str) -> str:
+    """
+    Swap the sync driver for its async counterpart,
+    e.g. mysql+pymysql:// -> mysql+aiomysql://, sqlite:// -> sqlite+aiosqlite://
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}', set ASYNC_DATABASE_URL")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+engine = create_engine(DATABASE_URL, future=True, **_engine_options(DATABASE_URL))
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+Base = declarative_base()
+
+ASYNC_DATABASE_URL = None
+async_engine = None
+AsyncSessionLocal = None
+
+if USE_ASYNC_DB:
+    # Imported here so the async drivers stay optional for the sync path
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL))
+    # expire_on_commit=False: attributes stay readable after commit without another await
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,6 @@
+# app/dependencies.py
+# Re-exported so routers importing from app.deps share one implementation
+from app.database import get_db
+from app.utils.auth_user import get_current_user
+
+__all__ = ["get_db", "get_current_user"]
@@ -0,0 +1,181 @@
+"""
+Retention job: moves old rows out of the hot audit tables into their
+compact archive tables (app/models/archive.py), oldest first, in batches.
+
+    python -m app.jobs.retention [--dry-run] [--batch-size N] [--table NAME]
+
+Each batch copies up to `batch_size` rows with INSERT ... SELECT and deletes
+them from the source in the same transaction, so a crash loses nothing and
+locks are only held for one batch. Safe to run repeatedly (e.g. from cron).
+"""
+import argparse
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal, engine
+from app.models.AuditLog import AuditLog
+from app.models.address_audit import AddressAudit
+from app.models.otp_log import OTPLog
+from app.models.archive import AuditLogArchive, AddressAuditArchive, OTPLogArchive
+
+# Load .env file
+load_dotenv()
+
+AUDIT_LOG_RETENTION_DAYS = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", 90))
+ADDRESS_AUDIT_RETENTION_DAYS = int(os.getenv("ADDRESS_AUDIT_RETENTION_DAYS", 365))
+OTP_LOG_RETENTION_DAYS = int(os.getenv("OTP_LOG_RETENTION_DAYS", 30))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", 1000))
+# Pause between batches so the job does not starve request traffic
+RETENTION_BATCH_PAUSE_SECONDS = float(os.getenv("RETENTION_BATCH_PAUSE_SECONDS", 0.1))
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionPolicy(NamedTuple):
+    source: type
+    archive: type
+    time_column: str
+    # Columns copied to the archive table, everything else is dropped
+    columns: Tuple[str, ...]
+    retention_days: int
+
+
+POLICIES = (
+    RetentionPolicy(
+        AuditLog, AuditLogArchive, "created_at",
+        ("id", "user_id", "cart_id", "action", "entity_type", "entity_id", "details", "ip_address", "created_at"),
+        AUDIT_LOG_RETENTION_DAYS
+    ),
+    RetentionPolicy(
+        AddressAudit, AddressAuditArchive, "created_at",
+        ("id", "user_id", "address_id", "action", "created_at"),
+        ADDRESS_AUDIT_RETENTION_DAYS
+    ),
+    RetentionPolicy(
+        OTPLog, OTPLogArchive, "generated_at",
+        ("id", "phone_number", "status", "generated_at", "verified_at"),
+        OTP_LOG_RETENTION_DAYS
+    ),
+)
+
+
+def _expired(policy: RetentionPolicy, cutoff: datetime):
+    return getattr(policy.source, policy.time_column) < cutoff
+
+
+def count_expired(db: Session, policy: RetentionPolicy, cutoff: datetime) -> int:
+    """
+    Number of rows older than `cutoff` in the policy's source table.
+    """
+    return db.query(func.count(policy.source.id)).filter(_expired(policy, cutoff)).scalar()
+
+
+def archive_batch(db: Session, policy: RetentionPolicy, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move up to `batch_size` of the oldest rows older than `cutoff` into the
+    archive table and commit. Returns the number of rows moved.
+    """
+    source = policy.source
+    ids = [
+        row.id for row in
+        db.query(source.id)
+        .filter(_expired(policy, cutoff))
+        .order_by(getattr(source, policy.time_column), source.id)
+        .limit(batch_size)
+        .all()
+    ]
+    if not ids:
+        return 0
+
+    try:
+        db.execute(
+            insert(policy.archive).from_select(
+                list(policy.columns),
+                select(*(getattr(source, name) for name in policy.columns)).where(source.id.in_(ids))
+            )
+        )
+        db.execute(
+            delete(source)
+            .where(source.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    return len(ids)
+
+
+def archive_table(
+    policy: RetentionPolicy,
+    now: datetime,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    pause: float = RETENTION_BATCH_PAUSE_SECONDS,
+    dry_run: bool = False
+) -> int:
+    """
+    Archive every expired row of one table, batch by batch.
+    Returns the number of rows moved (or that would be moved with dry_run).
+    """
+    cutoff = now - timedelta(days=policy.retention_days)
+    table = policy.source.__tablename__
+
+    db = SessionLocal()
+    try:
+        if dry_run:
+            expired = count_expired(db, policy, cutoff)
+            logger.info("%s: %d rows older than %s", table, expired, cutoff.isoformat())
+            return expired
+
+        moved = 0
+        while True:
+            count = archive_batch(db, policy, cutoff, batch_size)
+            moved += count
+            if count < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+
+        logger.info("%s: archived %d rows older than %s", table, moved, cutoff.isoformat())
+        return moved
+    finally:
+        db.close()
+
+
+def run(batch_size: int = RETENTION_BATCH_SIZE, dry_run: bool = False, table: str = None) -> dict:
+    """
+    Apply every retention policy (or only the one for `table`).
+    Returns rows moved per source table.
+    """
+    Base.metadata.create_all(bind=engine, tables=[policy.archive.__table__ for policy in POLICIES])
+
+    # Audit timestamps are written in UTC (see crud.audit.queue_audit_log)
+    now = datetime.utcnow()
+    return {
+        policy.source.__tablename__: archive_table(policy, now, batch_size=batch_size, dry_run=dry_run)
+        for policy in POLICIES
+        if table is None or policy.source.__tablename__ == table
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move expired audit rows into archive tables.")
+    parser.add_argument("--dry-run", action="store_true", help="only count expired rows")
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE)
+    parser.add_argument("--table", choices=[policy.source.__tablename__ for policy in POLICIES])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    run(batch_size=args.batch_size, dry_run=args.dry_run, table=args.table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+from .database import Base, engine, async_engine, USE_ASYNC_DB
+from .routers import product_router, cart_router , auth
+from app.models.otp_log import OTPLog
+from app.routers import profile,address,member,audit
+from app.models import archive  # noqa: F401  archive tables for app.jobs.retention
+from app.routers import metrics as metrics_router
+from app.middleware.metrics import METRICS_ENABLED, MetricsMiddleware, install_query_hooks
+from app.utils.audit_writer import audit_writer
+
+
+
+Base.metadata.create_all(bind=engine)
+app = FastAPI()
+
+if METRICS_ENABLED:
+    # Per-route latency, query counts and DB time, exposed at /metrics
+    install_query_hooks(engine)
+    if async_engine is not None:
+        install_query_hooks(async_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router.router)
+
+
+@app.on_event("startup")
+def start_audit_writer():
+    audit_writer.start()
+
+
+@app.on_event("shutdown")
+def stop_audit_writer():
+    # Flush queued audit records before the process exits
+    audit_writer.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app.include_router(member.router)
+app.include_router(address.router)
+# Cart, product and auth run as async def on AsyncSession when USE_ASYNC_DB is set
+if USE_ASYNC_DB:
+    app.include_router(product_router.async_router)
+    app.include_router(cart_router.async_router)
+    app.include_router(auth.async_router)
+else:
+    app.include_router(product_router.router)
+    app.include_router(cart_router.router)
+    app.include_router(auth.router)
+app.include_router(profile.router)
+app.include_router(audit.router)
\ No newline at end of file
@@ -0,0 +1,208 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Load .env file
+load_dotenv()
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Same statement run more than this many times in one request is reported as a likely N+1
+METRICS_N_PLUS_ONE_THRESHOLD = int(os.getenv("METRICS_N_PLUS_ONE_THRESHOLD", 10))
+METRICS_SLOW_QUERY_MS = float(os.getenv("METRICS_SLOW_QUERY_MS", 200))
+METRICS_SLOW_REQUEST_MS = float(os.getenv("METRICS_SLOW_REQUEST_MS", 1000))
+
+# Histogram buckets for request latency, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """
+    Database work done while serving one request.
+    """
+    __slots__ = ("query_count", "db_time", "statements")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.statements: Dict[str, int] = defaultdict(int)
+
+
+# Set by the middleware; threadpool routes and run_sync inherit the context,
+# so their queries are counted against the request that issued them.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsRegistry:
+    """
+    Process-wide counters and latency histograms, rendered in Prometheus text format.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # (method, route, status) -> [bucket counts..., +Inf count], sum
+        self._latency: Dict[Tuple[str, str, str], list] = {}
+        self._latency_sum: Dict[Tuple[str, str, str], float] = defaultdict(float)
+        # (method, route) -> value
+        self._queries: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._db_time: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._n_plus_one: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._slow_queries = 0
+
+    def observe_request(self, method: str, route: str, status: int, duration: float, stats: RequestStats):
+        key = (method, route, str(status))
+        with self._lock:
+            counts = self._latency.get(key)
+            if counts is None:
+                counts = self._latency[key] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, duration)] += 1
+            self._latency_sum[key] += duration
+            self._queries[(method, route)] += stats.query_count
+            self._db_time[(method, route)] += stats.db_time
+
+    def record_n_plus_one(self, method: str, route: str):
+        with self._lock:
+            self._n_plus_one[(method, route)] += 1
+
+    def record_slow_query(self):
+        with self._lock:
+            self._slow_queries += 1
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            lines.append("# HELP http_request_duration_seconds Request latency by route.")
+            lines.append("# TYPE http_request_duration_seconds histogram")
+            for (method, route, status), counts in sorted(self._latency.items()):
+                labels = f'method="{method}",route="{route}",status="{status}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                cumulative += counts[-1]
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {self._latency_sum[(method, route, status)]}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+            lines.append("# HELP db_queries_total SQL statements executed while serving requests.")
+            lines.append("# TYPE db_queries_total counter")
+            for (method, route), value in sorted(self._queries.items()):
+                lines.append(f'db_queries_total{{method="{method}",route="{route}"}} {value}')
+
+            lines.append("# HELP db_query_duration_seconds_total Time spent in SQL statements per route.")
+            lines.append("# TYPE db_query_duration_seconds_total counter")
+            for (method, route), value in sorted(self._db_time.items()):
+                lines.append(f'db_query_duration_seconds_total{{method="{method}",route="{route}"}} {value}')
+
+            lines.append("# HELP db_n_plus_one_total Requests that repeated one statement above the N+1 threshold.")
+            lines.append("# TYPE db_n_plus_one_total counter")
+            for (method, route), value in sorted(self._n_plus_one.items()):
+                lines.append(f'db_n_plus_one_total{{method="{method}",route="{route}"}} {value}')
+
+            lines.append("# HELP db_slow_queries_total Statements slower than METRICS_SLOW_QUERY_MS.")
+            lines.append("# TYPE db_slow_queries_total counter")
+            lines.append(f"db_slow_queries_total {self._slow_queries}")
+        return "\n".join(lines) + "\n"
+
+
+# single instance
+metrics = MetricsRegistry()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_start", time.perf_counter())
+
+    if elapsed * 1000 > METRICS_SLOW_QUERY_MS:
+        metrics.record_slow_query()
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement[:500])
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_time += elapsed
+        stats.statements[statement] += 1
+
+
+def install_query_hooks(engine: Engine):
+    """
+    Count queries and DB time per request on `engine` (pass async_engine.sync_engine for async).
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency and DB usage, adding a
+    Server-Timing header and warning about N+1 patterns and slow requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                server_timing = (
+                    f'app;dur={total_ms:.1f}, '
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.query_count} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", server_timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            duration = time.perf_counter() - start
+            route = scope.get("route")
+            # Route templates keep label cardinality bounded, raw paths would not
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            metrics.observe_request(method, route_path, status_code, duration, stats)
+            self._report(method, route_path, duration, stats)
+
+    @staticmethod
+    def _report(method: str, route: str, duration: float, stats: RequestStats):
+        if duration * 1000 > METRICS_SLOW_REQUEST_MS:
+            logger.warning(
+                "Slow request %s %s: %.1f ms, %d queries, %.1f ms in DB",
+                method, route, duration * 1000, stats.query_count, stats.db_time * 1000
+            )
+
+        repeated = [(s, n) for s, n in stats.statements.items() if n > METRICS_N_PLUS_ONE_THRESHOLD]
+        if repeated:
+            metrics.record_n_plus_one(method, route)
+            for statement, count in repeated:
+                logger.warning(
+                    "Possible N+1 in %s %s: statement ran %d times: %s",
+                    method, route, count, statement[:500]
+                )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, func
+from app.database import Base
+
+class AuditLog(Base):
+    __tablename__ = "audit_logs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=True, index=True)
+    username = Column(String(255), nullable=True)
+    cart_id = Column(Integer, nullable=True)
+    action = Column(String(100), nullable=False)  # ADD, UPDATE, DELETE, VIEW, CLEAR
+    entity_type = Column(String(50), nullable=False)  # CART_ITEM, CART
+    entity_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)  # Store additional details as JSON
+    ip_address = Column(String(50), nullable=True)
+    user_agent = Column(String(500), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # keyset pagination: WHERE user_id / cart_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_audit_logs_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_audit_logs_cart_created_id", "cart_id", "created_at", "id"),
+        # retention job: oldest rows first
+        Index("ix_audit_logs_created_id", "created_at", "id"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, func
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+class CartItem(Base):
+    __tablename__ = "cart_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.ProductId"), nullable=False)
+    quantity = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    user = relationship("User")
+    product = relationship("Product")
+
+    __table_args__ = (
+        # one row per product in a user's cart (target of the bulk upsert)
+        UniqueConstraint("user_id", "product_id", name="uq_cart_items_user_product"),
+    )
@@ -0,0 +1,20 @@
+# app/models/address_audit.py
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
+from app.database import Base
+
+class AddressAudit(Base):
+    __tablename__ = "address_audit"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    username = Column(String(255), nullable=True)
+    phone_number = Column(String(20), nullable=True)
+    address_id = Column(Integer, nullable=False)
+    action = Column(String(50))  # created / updated
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # retention job: oldest rows first
+        Index("ix_address_audit_created_id", "created_at", "id"),
+    )
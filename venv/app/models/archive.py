@@ -0,0 +1,56 @@
+# app/models/archive.py
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, func
+from app.database import Base
+
+# Compact copies of rows moved out of the hot audit tables by app.jobs.retention.
+# Ids are kept from the source row; bulky or sensitive columns (user agents,
+# OTP hashes) are dropped.
+
+
+class AuditLogArchive(Base):
+    __tablename__ = "audit_logs_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=True)
+    cart_id = Column(Integer, nullable=True)
+    action = Column(String(100), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)
+    ip_address = Column(String(50), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_audit_logs_archive_user_created", "user_id", "created_at"),
+    )
+
+
+class AddressAuditArchive(Base):
+    __tablename__ = "address_audit_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    address_id = Column(Integer, nullable=False)
+    action = Column(String(50))
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_address_audit_archive_user_created", "user_id", "created_at"),
+    )
+
+
+class OTPLogArchive(Base):
+    __tablename__ = "otp_logs_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    phone_number = Column(String(30), nullable=False)
+    status = Column(String(20), nullable=False)
+    generated_at = Column(DateTime(timezone=True), nullable=True)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_otp_logs_archive_phone_generated", "phone_number", "generated_at"),
+    )
@@ -0,0 +1,127 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Literal, Optional
+import csv
+import io
+import json
+
+from app.deps import get_db
+from app.database import SessionLocal
+from app.utils.auth_user import get_current_user
+from app.models.User import User
+from app.crud.audit import get_audit_logs_by_user, iter_audit_log_chunks
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+# Rows fetched per keyset query while streaming an export
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_FIELDS = ("id", "action", "entity_type", "entity_id", "cart_id", "details", "created_at")
+
+
+def _log_data(log) -> dict:
+    return {
+        "id": log.id,
+        "action": log.action,
+        "entity_type": log.entity_type,
+        "entity_id": log.entity_id,
+        "cart_id": log.cart_id,
+        "details": log.details,
+        "created_at": log.created_at.isoformat() if log.created_at else None
+    }
+
+
+def _filters(
+    action: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> dict:
+    """Shared query parameters: action, entity type and a [created_from, created_to) range"""
+    return {
+        "action": action,
+        "entity_type": entity_type,
+        "created_from": created_from,
+        "created_to": created_to
+    }
+
+
+def _ndjson_chunks(user_id: int, filters: dict):
+    # Own session: the request's session is closed once the route returns
+    db = SessionLocal()
+    try:
+        for logs in iter_audit_log_chunks(db, user_id, chunk_size=EXPORT_CHUNK_SIZE, **filters):
+            yield "".join(json.dumps(_log_data(log), ensure_ascii=False) + "\n" for log in logs)
+    finally:
+        db.close()
+
+
+def _csv_chunks(user_id: int, filters: dict):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    db = SessionLocal()
+    try:
+        for logs in iter_audit_log_chunks(db, user_id, chunk_size=EXPORT_CHUNK_SIZE, **filters):
+            buffer.seek(0)
+            buffer.truncate()
+            for log in logs:
+                row = _log_data(log)
+                row["details"] = json.dumps(row["details"], ensure_ascii=False) if row["details"] is not None else ""
+                writer.writerow(row)
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+@router.get("/my-activity")
+def get_my_audit_logs(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    filters: dict = Depends(_filters),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get one page of audit logs for current user, newest first"""
+
+    try:
+        logs, next_cursor = get_audit_logs_by_user(db, current_user.id, limit=limit, cursor=cursor, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "status": "success",
+        "message": "Audit logs fetched successfully.",
+        "data": {
+            "user_id": current_user.id,
+            "username": current_user.name or current_user.mobile,
+            "total_logs": len(logs),
+            "logs": [_log_data(log) for log in logs],
+            "next_cursor": next_cursor
+        }
+    }
+
+
+@router.get("/my-activity/export")
+def export_my_audit_logs(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    filters: dict = Depends(_filters),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every matching audit log for current user as NDJSON or CSV"""
+
+    if format == "csv":
+        return StreamingResponse(
+            _csv_chunks(current_user.id, filters),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="audit-logs.csv"'}
+        )
+    return StreamingResponse(
+        _ndjson_chunks(current_user.id, filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="audit-logs.ndjson"'}
+    )
@@ -0,0 +1,270 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.schemas.auth import (
+    SendOTPRequest,
+    SendOTPResponse,
+    OTPData,
+    VerifyOTPRequest,
+    VerifyOTPResponse,
+    VerifiedData
+)
+from app.deps import get_db
+from app.database import get_async_db
+from app.utils import otp_manager, security
+from app.crud.auth import login_with_verified_otp
+from app.crud import otp_log
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+OTP_EXPIRY_SECONDS = int(os.getenv("OTP_EXPIRY_SECONDS", 300))
+ACCESS_TOKEN_EXPIRE_SECONDS = int(os.getenv("ACCESS_TOKEN_EXPIRE_SECONDS", 86400))
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+# Same endpoints as `async def` on the AsyncSession path, mounted instead of `router`
+async_router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+# OTP store calls (Redis / SQLite / in-process) and database work are kept in
+# separate helpers: the async routes run the former in the threadpool and the
+# latter through AsyncSession.run_sync, so neither blocks the event loop.
+
+def _check_otp_rate_limit(request: SendOTPRequest):
+    if not otp_manager.can_request_otp(request.country_code, request.mobile):
+        remaining = otp_manager.get_remaining_requests(request.country_code, request.mobile)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"OTP request limit reached. Remaining: {remaining}"
+        )
+
+
+def _create_sent_log(db: Session, request: SendOTPRequest, otp: str) -> int:
+    # Store hashed version in DB audit log
+    sent_log = otp_log.create_sent_log(
+        db=db,
+        phone_number=f"{request.country_code}{request.mobile}",
+        otp_hash=security.hash_value(otp)
+    )
+    return sent_log.id
+
+
+def _store_otp(request: SendOTPRequest, otp: str, sent_log_id: int):
+    # Keep the log id next to the OTP so verify-otp can update it directly
+    otp_manager.store_otp(
+        request.country_code,
+        request.mobile,
+        otp,
+        expires_in=OTP_EXPIRY_SECONDS,
+        log_id=sent_log_id
+    )
+
+
+def _send_otp_response(request: SendOTPRequest, otp: str) -> SendOTPResponse:
+    message = f"OTP sent successfully to {request.mobile}."
+
+    data = OTPData(
+        mobile=request.mobile,
+        otp=otp,
+        expires_in=OTP_EXPIRY_SECONDS,
+        purpose=request.purpose
+    )
+    return SendOTPResponse(status="success", message=message, data=data)
+
+
+def _send_otp(db: Session, request: SendOTPRequest) -> SendOTPResponse:
+    _check_otp_rate_limit(request)
+
+    # Generate OTP
+    otp = otp_manager.generate_otp()
+
+    sent_log_id = _create_sent_log(db, request, otp)
+    _store_otp(request, otp, sent_log_id)
+
+    return _send_otp_response(request, otp)
+
+
+class _WrongOTP(Exception):
+    pass
+
+
+def _take_matching_otp(req: VerifyOTPRequest) -> dict:
+    """
+    Check the OTP and consume it from the OTP store.
+    Raises 400 when it expired or was never sent, _WrongOTP when it does not match.
+    """
+    # Fetch OTP from the OTP store (plaintext)
+    stored, _ = otp_manager.get_otp_entry(req.country_code, req.mobile)
+    if not stored:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="OTP expired or not found"
+        )
+
+    # Compare plaintext (fast check)
+    if stored != req.otp:
+        raise _WrongOTP()
+
+    # Consume the OTP before logging in, so only one of several concurrent
+    # verifications with the same OTP can get past this point
+    entry = otp_manager.take_otp_entry(req.country_code, req.mobile)
+    if entry is None or entry["otp"] != req.otp:
+        if entry is not None:
+            # replaced by a newer OTP in the meantime
+            otp_manager.restore_otp_entry(req.country_code, req.mobile, entry)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="OTP expired or not found"
+        )
+    return entry
+
+
+def _reject_wrong_otp(db: Session, req: VerifyOTPRequest):
+    otp_log.mark_failed(
+        db=db,
+        phone_number=f"{req.country_code}{req.mobile}",
+        user_entered_otp_hash=security.hash_value(req.otp)
+    )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid OTP"
+    )
+
+
+def _login(
+    db: Session,
+    req: VerifyOTPRequest,
+    entry: dict,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    # Mark OTP verified, get or create user and open the session in one transaction
+    return login_with_verified_otp(
+        db=db,
+        mobile=req.mobile,
+        phone_number=f"{req.country_code}{req.mobile}",
+        sent_log_id=entry.get("log_id"),
+        user_entered_otp_hash=security.hash_value(req.otp),
+        device_id=req.device_id,
+        device_platform=req.device_platform or "unknown",
+        device_details=req.device_details,
+        ip=ip,
+        user_agent=user_agent,
+        expires_in_seconds=ACCESS_TOKEN_EXPIRE_SECONDS
+    )
+
+
+def _verified_response(req: VerifyOTPRequest, user) -> VerifyOTPResponse:
+    token = security.create_access_token({
+        "sub": str(user.id),
+        "session_id": str(user.session_id),
+        "device_platform": req.device_platform or "unknown"
+    }, expires_delta=ACCESS_TOKEN_EXPIRE_SECONDS)
+
+    data = VerifiedData(
+        user_id=user.id,
+        name=user.name,
+        mobile=user.mobile,
+        email=user.email,
+        access_token=token,
+        token_type="Bearer",
+        expires_in=ACCESS_TOKEN_EXPIRE_SECONDS
+    )
+
+    return VerifyOTPResponse(
+        status="success",
+        message="OTP verified successfully.",
+        data=data
+    )
+
+
+def _verify_otp(
+    db: Session,
+    req: VerifyOTPRequest,
+    ip: Optional[str],
+    user_agent: Optional[str]
+) -> VerifyOTPResponse:
+    try:
+        entry = _take_matching_otp(req)
+    except _WrongOTP:
+        _reject_wrong_otp(db, req)
+
+    try:
+        user = _login(db, req, entry, ip, user_agent)
+    except Exception:
+        # The login did not happen, let the user retry with the same OTP
+        otp_manager.restore_otp_entry(req.country_code, req.mobile, entry)
+        raise
+
+    return _verified_response(req, user)
+
+
+def _client_info(request: Request):
+    ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+    return ip, user_agent
+
+
+# ---------------- SYNC ROUTES ---------------- #
+
+@router.post("/send-otp", response_model=SendOTPResponse)
+def send_otp(request: SendOTPRequest, db: Session = Depends(get_db)):
+    """
+    Send OTP to the provided mobile number.
+    Rate limited to prevent abuse.
+    """
+    return _send_otp(db, request)
+
+
+@router.post("/verify-otp", response_model=VerifyOTPResponse)
+def verify_otp(req: VerifyOTPRequest, request: Request, db: Session = Depends(get_db)):
+    """
+    Verify OTP and create user session.
+    Returns access token on successful verification.
+    """
+    return _verify_otp(db, req, *_client_info(request))
+
+
+# ---------------- ASYNC ROUTES (USE_ASYNC_DB) ---------------- #
+
+@async_router.post("/send-otp", response_model=SendOTPResponse)
+async def send_otp_async(request: SendOTPRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Send OTP to the provided mobile number.
+    Rate limited to prevent abuse.
+    """
+    await run_in_threadpool(_check_otp_rate_limit, request)
+
+    # Generate OTP
+    otp = otp_manager.generate_otp()
+
+    sent_log_id = await db.run_sync(_create_sent_log, request, otp)
+    await run_in_threadpool(_store_otp, request, otp, sent_log_id)
+
+    return _send_otp_response(request, otp)
+
+
+@async_router.post("/verify-otp", response_model=VerifyOTPResponse)
+async def verify_otp_async(req: VerifyOTPRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Verify OTP and create user session.
+    Returns access token on successful verification.
+    """
+    try:
+        entry = await run_in_threadpool(_take_matching_otp, req)
+    except _WrongOTP:
+        await db.run_sync(_reject_wrong_otp, req)
+
+    try:
+        user = await db.run_sync(_login, req, entry, *_client_info(request))
+    except Exception:
+        # The login did not happen, let the user retry with the same OTP
+        await run_in_threadpool(otp_manager.restore_otp_entry, req.country_code, req.mobile, entry)
+        raise
+
+    return _verified_response(req, user)
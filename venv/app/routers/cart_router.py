@@ -0,0 +1,413 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.database import get_async_db
+from app.models.CartItemModel import CartItem
+from app.models.User import User
+from app.schemas.CartItem import CartAdd, CartUpdate, CartOperation, CartBulkRequest
+from app.deps import get_db
+from app.utils.auth_user import get_current_user, get_current_user_async
+from app.crud.audit import queue_audit_log
+from app.crud.cart import (
+    apply_cart_operations,
+    find_missing_products,
+    get_cart_view,
+    invalidate_cart,
+    refresh_cart_view
+)
+
+router = APIRouter(prefix="/cart", tags=["Cart"])
+
+# Same endpoints as `async def` on the AsyncSession path, mounted instead of `router`
+async_router = APIRouter(prefix="/cart", tags=["Cart"])
+
+
+def get_client_info(request: Request):
+    """Extract client IP and user agent from request"""
+    ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+    return ip, user_agent
+
+
+def _cart_response_data(current_user: User, cart: dict) -> dict:
+    return {
+        "user_id": current_user.id,
+        "username": current_user.name or current_user.mobile,
+        "cart_summary": cart["cart_summary"],
+        "cart_items": cart["cart_items"]
+    }
+
+
+def _cart_change_audit(product_id: int, op: str, quantity: int, previous, line):
+    """
+    Action, cart item id and details for one applied change, or None when nothing changed.
+    previous is the (cart_item_id, quantity) the product had before, line its line after.
+    """
+    if op == "remove":
+        if previous is None:
+            return None
+        return "DELETE", previous[0], {"product_id": product_id, "quantity": previous[1]}
+
+    if previous is None:
+        return "ADD", line["cart_item_id"], {"product_id": product_id, "quantity": line["quantity"]}
+
+    details = {
+        "product_id": product_id,
+        "old_quantity": previous[1],
+        "new_quantity": line["quantity"]
+    }
+    if op == "add":
+        details["quantity_added"] = quantity
+    return "UPDATE", previous[0], details
+
+
+def _apply_cart_operations(
+    db: Session,
+    current_user: User,
+    operations: List[CartOperation],
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    """
+    Validate product ids, apply the operations and return the recomputed cart
+    with its lines keyed by product id.
+    """
+    # All product ids checked with one IN query (removals, including set 0, don't need to exist)
+    missing = find_missing_products(db, [o.product_id for o in operations if not o.removes])
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Product not found: {', '.join(map(str, sorted(missing)))}"
+        )
+
+    applied, previous = apply_cart_operations(db, current_user.id, operations)
+    cart = refresh_cart_view(db, current_user.id)
+    lines = {line["product_id"]: line for line in cart["cart_items"]}
+
+    # Audit log
+    for product_id, (op, quantity) in applied.items():
+        audit = _cart_change_audit(product_id, op, quantity, previous.get(product_id), lines.get(product_id))
+        if audit is None:
+            continue
+        action, cart_item_id, details = audit
+        queue_audit_log(
+            user=current_user,
+            action=action,
+            entity_type="CART_ITEM",
+            entity_id=cart_item_id,
+            cart_id=cart_item_id if action != "DELETE" else None,
+            details=details,
+            ip_address=ip,
+            user_agent=user_agent
+        )
+
+    return cart, lines
+
+
+def _line_data(line: dict) -> dict:
+    return {
+        "cart_item_id": line["cart_item_id"],
+        "product_id": line["product_id"],
+        "quantity": line["quantity"],
+        "price": line["price"],
+        "special_price": line["special_price"],
+        "total_amount": line["total_amount"]
+    }
+
+
+def _get_own_cart_item(db: Session, current_user: User, cart_item_id: int) -> CartItem:
+    cart_item = db.query(CartItem).filter(
+        CartItem.id == cart_item_id,
+        CartItem.user_id == current_user.id
+    ).first()
+
+    if not cart_item:
+        raise HTTPException(status_code=404, detail="Cart item not found")
+    return cart_item
+
+
+def _bulk_update_cart(
+    db: Session,
+    current_user: User,
+    payload: CartBulkRequest,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    cart, _ = _apply_cart_operations(db, current_user, payload.operations, ip, user_agent)
+
+    return {
+        "status": "success",
+        "message": f"Applied {len(payload.operations)} cart operation(s).",
+        "data": _cart_response_data(current_user, cart)
+    }
+
+
+def _add_to_cart(
+    db: Session,
+    current_user: User,
+    item: CartAdd,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    operation = CartOperation(op="add", product_id=item.product_id, quantity=item.quantity)
+    _, lines = _apply_cart_operations(db, current_user, [operation], ip, user_agent)
+
+    return {
+        "status": "success",
+        "message": "Product added to cart successfully.",
+        "data": _line_data(lines[item.product_id])
+    }
+
+
+def _update_cart_item(
+    db: Session,
+    current_user: User,
+    cart_item_id: int,
+    update: CartUpdate,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    cart_item = _get_own_cart_item(db, current_user, cart_item_id)
+
+    operation = CartOperation(op="set", product_id=cart_item.product_id, quantity=update.quantity)
+    _, lines = _apply_cart_operations(db, current_user, [operation], ip, user_agent)
+
+    return {
+        "status": "success",
+        "message": "Cart item updated successfully.",
+        "data": _line_data(lines[operation.product_id])
+    }
+
+
+def _delete_cart_item(
+    db: Session,
+    current_user: User,
+    cart_item_id: int,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    cart_item = _get_own_cart_item(db, current_user, cart_item_id)
+
+    operation = CartOperation(op="remove", product_id=cart_item.product_id)
+    _apply_cart_operations(db, current_user, [operation], ip, user_agent)
+
+    return {
+        "status": "success",
+        "message": f"Cart item {cart_item_id} deleted successfully."
+    }
+
+
+def _clear_cart(
+    db: Session,
+    current_user: User,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    deleted_count = db.query(CartItem).filter(
+        CartItem.user_id == current_user.id
+    ).delete()
+    db.commit()
+    invalidate_cart(current_user.id)
+    
+    # Audit log
+    queue_audit_log(
+        user=current_user,
+        action="CLEAR",
+        entity_type="CART",
+        details={
+            "items_deleted": deleted_count
+        },
+        ip_address=ip,
+        user_agent=user_agent
+    )
+    
+    return {
+        "status": "success",
+        "message": f"Cleared {deleted_count} item(s) from the cart."
+    }
+
+
+def _view_cart(
+    db: Session,
+    current_user: User,
+    ip: Optional[str],
+    user_agent: Optional[str]
+):
+    # Items and products come from one joined query, or from the cart cache
+    cart = get_cart_view(db, current_user.id)
+    summary = cart["cart_summary"]
+
+    if not summary:
+        # Audit log
+        queue_audit_log(
+            user=current_user,
+            action="VIEW",
+            entity_type="CART",
+            details={"items_count": 0},
+            ip_address=ip,
+            user_agent=user_agent
+        )
+
+        return {
+            "status": "success",
+            "message": "Cart is empty.",
+            "data": {
+                "cart_summary": None,
+                "cart_items": []
+            }
+        }
+
+    # Audit log
+    queue_audit_log(
+        user=current_user,
+        action="VIEW",
+        entity_type="CART",
+        details={
+            "items_count": summary["total_items"],
+            "grand_total": summary["grand_total"]
+        },
+        ip_address=ip,
+        user_agent=user_agent
+    )
+
+    return {
+        "status": "success",
+        "message": "Cart data fetched successfully.",
+        "data": _cart_response_data(current_user, cart)
+    }
+
+
+# ---------------- SYNC ROUTES ---------------- #
+
+@router.post("/bulk")
+def bulk_update_cart(
+    payload: CartBulkRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Apply several add/set/remove operations and return the updated cart (requires authentication)"""
+    return _bulk_update_cart(db, current_user, payload, *get_client_info(request))
+
+
+@router.post("/add")
+def add_to_cart(
+    item: CartAdd,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Add item to cart (requires authentication)"""
+    return _add_to_cart(db, current_user, item, *get_client_info(request))
+
+
+@router.put("/update/{cart_item_id}")
+def update_cart_item(
+    cart_item_id: int,
+    update: CartUpdate,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update cart item quantity (requires authentication)"""
+    return _update_cart_item(db, current_user, cart_item_id, update, *get_client_info(request))
+
+
+@router.delete("/delete/{cart_item_id}")
+def delete_cart_item(
+    cart_item_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete cart item (requires authentication)"""
+    return _delete_cart_item(db, current_user, cart_item_id, *get_client_info(request))
+
+
+@router.delete("/clear")
+def clear_cart(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Clear all cart items for current user (requires authentication)"""
+    return _clear_cart(db, current_user, *get_client_info(request))
+
+
+@router.get("/view")
+def view_cart(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """View cart items for current user (requires authentication)"""
+    return _view_cart(db, current_user, *get_client_info(request))
+
+
+# ---------------- ASYNC ROUTES (USE_ASYNC_DB) ---------------- #
+
+@async_router.post("/bulk")
+async def bulk_update_cart_async(
+    payload: CartBulkRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Apply several add/set/remove operations and return the updated cart (requires authentication)"""
+    return await db.run_sync(_bulk_update_cart, current_user, payload, *get_client_info(request))
+
+
+@async_router.post("/add")
+async def add_to_cart_async(
+    item: CartAdd,
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Add item to cart (requires authentication)"""
+    return await db.run_sync(_add_to_cart, current_user, item, *get_client_info(request))
+
+
+@async_router.put("/update/{cart_item_id}")
+async def update_cart_item_async(
+    cart_item_id: int,
+    update: CartUpdate,
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update cart item quantity (requires authentication)"""
+    return await db.run_sync(_update_cart_item, current_user, cart_item_id, update, *get_client_info(request))
+
+
+@async_router.delete("/delete/{cart_item_id}")
+async def delete_cart_item_async(
+    cart_item_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Delete cart item (requires authentication)"""
+    return await db.run_sync(_delete_cart_item, current_user, cart_item_id, *get_client_info(request))
+
+
+@async_router.delete("/clear")
+async def clear_cart_async(
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Clear all cart items for current user (requires authentication)"""
+    return await db.run_sync(_clear_cart, current_user, *get_client_info(request))
+
+
+@async_router.get("/view")
+async def view_cart_async(
+    request: Request,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """View cart items for current user (requires authentication)"""
+    return await db.run_sync(_view_cart, current_user, *get_client_info(request))
@@ -0,0 +1,148 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+from dotenv import load_dotenv
+import hashlib
+import json
+import os
+
+from app.deps import get_db
+from app.database import get_async_db
+from app.crud import product as product_crud
+from app.utils.cache import TTLCache
+from app.schemas.Product import (
+    ProductCreate,
+    ProductResponse,
+    ProductListResponse,
+    ProductSingleResponse
+)
+
+load_dotenv()
+
+PRODUCT_CACHE_TTL_SECONDS = float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", 300))
+PRODUCT_CACHE_MAX_SIZE = int(os.getenv("PRODUCT_CACHE_MAX_SIZE", 2048))
+
+# Serialized response bodies and their ETags, keyed by page / product id
+product_list_cache = TTLCache(max_size=PRODUCT_CACHE_MAX_SIZE, ttl=PRODUCT_CACHE_TTL_SECONDS)
+product_detail_cache = TTLCache(max_size=PRODUCT_CACHE_MAX_SIZE, ttl=PRODUCT_CACHE_TTL_SECONDS)
+
+router = APIRouter(prefix="/products", tags=["Products"])
+
+# Same endpoints as `async def` on the AsyncSession path, mounted instead of `router`
+async_router = APIRouter(prefix="/products", tags=["Products"])
+
+
+def _serialize(payload: dict):
+    """Encode a response payload once and compute its ETag"""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    return body, etag
+
+
+def _cached_response(request: Request, cached) -> Response:
+    """Return 304 when the client already has this body, the body otherwise"""
+    body, etag = cached
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _create_product(db: Session, payload: ProductCreate):
+    new_product = product_crud.create_product(db, payload.dict())
+
+    # A new product changes the listing pages, product details stay valid
+    product_list_cache.clear()
+
+    return {
+        "status": "success",
+        "message": "Product created successfully.",
+        "data": new_product
+    }
+
+
+def _load_product_page(db: Session, cursor: Optional[int], limit: int, fields: str):
+    products, next_cursor = product_crud.list_products(db, limit=limit, cursor=cursor, fields=fields)
+    return _serialize({
+        "status": "success",
+        "message": "Product list fetched successfully.",
+        "data": products,
+        "next_cursor": next_cursor
+    })
+
+
+def _load_product_detail(db: Session, ProductId: int):
+    # Use ProductId as in the model
+    product = product_crud.get_product(db, ProductId)
+
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    return _serialize({
+        "status": "success",
+        "message": "Product fetched successfully.",
+        "data": ProductResponse.from_orm(product).dict()
+    })
+
+
+# ---------------- SYNC ROUTES ---------------- #
+
+@router.post("/addProduct", response_model=ProductSingleResponse)
+def create_product(payload: ProductCreate, db: Session = Depends(get_db)):
+    return _create_product(db, payload)
+
+
+@router.get("/viewProduct", response_model=ProductListResponse)
+def get_products(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = Query(None, ge=0, description="ProductId of the last item on the previous page"),
+    fields: Literal["full", "summary"] = Query("full", description="'summary' leaves out Description"),
+    db: Session = Depends(get_db)
+):
+    cached = product_list_cache.get_or_set(
+        (cursor, limit, fields),
+        lambda: _load_product_page(db, cursor, limit, fields)
+    )
+    return _cached_response(request, cached)
+
+
+@router.get("/detail/{ProductId}", response_model=ProductSingleResponse)
+def get_product_detail(ProductId: int, request: Request, db: Session = Depends(get_db)):
+    cached = product_detail_cache.get_or_set(ProductId, lambda: _load_product_detail(db, ProductId))
+    return _cached_response(request, cached)
+
+
+# ---------------- ASYNC ROUTES (USE_ASYNC_DB) ---------------- #
+
+@async_router.post("/addProduct", response_model=ProductSingleResponse)
+async def create_product_async(payload: ProductCreate, db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(_create_product, payload)
+
+
+@async_router.get("/viewProduct", response_model=ProductListResponse)
+async def get_products_async(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = Query(None, ge=0, description="ProductId of the last item on the previous page"),
+    fields: Literal["full", "summary"] = Query("full", description="'summary' leaves out Description"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    key = (cursor, limit, fields)
+    cached = product_list_cache.get(key)
+    if cached is None:
+        cached = await db.run_sync(_load_product_page, cursor, limit, fields)
+        product_list_cache.set(key, cached)
+    return _cached_response(request, cached)
+
+
+@async_router.get("/detail/{ProductId}", response_model=ProductSingleResponse)
+async def get_product_detail_async(ProductId: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    cached = product_detail_cache.get(ProductId)
+    if cached is None:
+        cached = await db.run_sync(_load_product_detail, ProductId)
+        product_detail_cache.set(ProductId, cached)
+    return _cached_response(request, cached)
@@ -0,0 +1,90 @@
+from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Literal
+
+class CartAdd(BaseModel):
+    product_id: int
+    quantity: int = Field(1, ge=1)
+
+
+class CartUpdate(BaseModel):
+    quantity: int = Field(..., ge=1)
+
+
+# add: increase quantity, set: replace quantity (0 removes), remove: drop the product
+class CartOperation(BaseModel):
+    op: Literal["add", "set", "remove"]
+    product_id: int
+    quantity: int = Field(1, ge=0)
+
+    @validator('quantity')
+    def validate_quantity(cls, v, values):
+        if values.get('op') == 'add' and v < 1:
+            raise ValueError('Quantity to add must be at least 1')
+        return v
+
+    @property
+    def removes(self) -> bool:
+        return self.op == "remove" or (self.op == "set" and self.quantity == 0)
+
+
+class CartBulkRequest(BaseModel):
+    operations: List[CartOperation] = Field(..., min_items=1, max_items=100)
+
+
+class CartItemResponse(BaseModel):
+    cart_id: int
+    user_id: Optional[int] = None
+    product_id: int
+    quantity: int
+    price: float
+    special_price: float
+    total_amount: float
+    cart_items_count: int
+
+    class Config:
+        orm_mode = True
+
+
+# ---------------- NEW CART RESPONSE SCHEMAS ---------------- #
+
+class CartItemDetail(BaseModel):
+    cart_item_id: int
+    product_id: int
+    product_name: str
+    product_image: str
+    price: float
+    special_price: float
+    quantity: int
+    total_amount: float
+
+    class Config:
+        orm_mode = True
+
+
+class CartSummary(BaseModel):
+    cart_id: int
+    total_items: int
+    subtotal_amount: float
+    discount_amount: float
+    delivery_charge: float
+    grand_total: float
+
+    class Config:
+        orm_mode = True
+
+
+class CartData(BaseModel):
+    cart_summary: CartSummary
+    cart_items: List[CartItemDetail]
+
+    class Config:
+        orm_mode = True
+
+
+class CartResponse(BaseModel):
+    status: str
+    message: str
+    data: CartData
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,44 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+# Create Body
+class ProductCreate(BaseModel):
+    Name: str
+    Price: float
+    SpecialPrice: float
+    ShortDescription: str
+    Discount: Optional[str] = None
+    Description: Optional[str] = None
+    Images: Optional[List[str]] = None
+
+
+# Single Product Response Shape
+class ProductResponse(BaseModel):
+    ProductId: int
+    Name: str
+    Price: float
+    SpecialPrice: float
+    ShortDescription: str
+    Discount: Optional[str] = None
+    Description: Optional[str] = None
+    Images: Optional[List[str]] = None
+
+    class Config:
+        orm_mode = True
+
+
+# Wrapper for Product List Response
+# Pass next_cursor back as ?cursor= to fetch the following page
+class ProductListResponse(BaseModel):
+    status: str
+    message: str
+    data: List[ProductResponse]
+    next_cursor: Optional[int] = None
+
+
+# Wrapper for Single Product (Add / Update)
+class ProductSingleResponse(BaseModel):
+    status: str
+    message: str
+    data: ProductResponse
@@ -0,0 +1,192 @@
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+
+# Load .env file
+load_dotenv()
+
+# Read audit pipeline settings from environment variables
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 100))
+AUDIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", 1.0))
+AUDIT_QUEUE_MAX_SIZE = int(os.getenv("AUDIT_QUEUE_MAX_SIZE", 10000))
+AUDIT_ENQUEUE_TIMEOUT_SECONDS = float(os.getenv("AUDIT_ENQUEUE_TIMEOUT_SECONDS", 0.5))
+AUDIT_SYNC_MODE = os.getenv("AUDIT_SYNC_MODE", "false").lower() in ("1", "true", "yes")
+
+logger = logging.getLogger(__name__)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Sentinel telling the worker to flush what it has and exit
+_STOP = object()
+
+AuditRecord = Tuple[type, Dict[str, Any]]
+
+
+class AuditWriter:
+    """
+    Buffers audit rows (AuditLog, AddressAudit, ...) in a bounded in-memory
+    queue and writes them with bulk inserts from a background thread.
+
+    A batch is flushed when `batch_size` rows are pending or `flush_interval`
+    seconds have passed, whichever comes first. When the queue is full a
+    threadpool caller waits up to `enqueue_timeout` seconds and then writes its
+    row inline, so a slow database slows requests down instead of growing memory.
+    With `sync=True` every row is written immediately (useful for tests).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = AUDIT_QUEUE_MAX_SIZE,
+        enqueue_timeout: float = AUDIT_ENQUEUE_TIMEOUT_SECONDS,
+        sync: bool = AUDIT_SYNC_MODE
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.sync = sync
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start the background flush thread (no-op in sync mode or if running).
+        """
+        if self.sync:
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """
+        Flush every queued record and stop the background thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is None or not thread.is_alive():
+            # No worker to hand the records to, write leftovers inline
+            self._write(self._drain())
+            return
+
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def submit(self, model: type, values: Dict[str, Any]):
+        """
+        Queue one row for `model`. Rows of the same model should use the same keys
+        so they can be sent as a single executemany.
+
+        Never blocks an event loop thread (async routes call this through
+        AsyncSession.run_sync): there a full queue, or sync mode, hands the
+        write to the loop's default executor instead of waiting or writing inline.
+        """
+        record = (model, values)
+        loop = _running_loop()
+
+        if not self.sync:
+            if self._thread is None:
+                self.start()
+            try:
+                if loop is None:
+                    self._queue.put(record, timeout=self.enqueue_timeout)
+                else:
+                    self._queue.put_nowait(record)
+                return
+            except queue.Full:
+                logger.warning("Audit queue is full, writing record directly")
+
+        if loop is None:
+            self._write([record])
+        else:
+            loop.run_in_executor(None, self._write, [record])
+
+    def pending(self) -> int:
+        """
+        Approximate number of records waiting to be written.
+        """
+        return self._queue.qsize()
+
+    def _run(self):
+        batch: List[AuditRecord] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                batch.extend(self._drain())
+                self._write(batch)
+                return
+
+            if item is not None:
+                batch.append(item)
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._write(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _drain(self) -> List[AuditRecord]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _write(self, batch: List[AuditRecord]):
+        if not batch:
+            return
+
+        # Group rows by model and column set so each group is one executemany
+        groups: Dict[Tuple[type, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for model, values in batch:
+            groups.setdefault((model, tuple(sorted(values))), []).append(values)
+
+        db = self.session_factory()
+        try:
+            for (model, _), rows in groups.items():
+                db.execute(insert(model), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to write %d audit record(s)", len(batch))
+        finally:
+            db.close()
+
+
+# single instance
+audit_writer = AuditWriter(SessionLocal)
+
+# Make sure queued records reach the database on interpreter exit
+atexit.register(audit_writer.stop)
@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from typing import Tuple
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.utils import security
+from app.database import get_db, get_async_db
+from app.models.User import User
+from app.models.device_session import DeviceSession
+from app.schemas.auth import AuthenticatedUser
+from app.utils.principal_cache import get_principal, set_principal, PRINCIPAL_CACHE_TTL_SECONDS
+
+security_scheme = HTTPBearer()
+
+
+def _seconds_until(expires_at: datetime) -> float:
+    now = datetime.now(timezone.utc) if expires_at.tzinfo else datetime.utcnow()
+    return (expires_at - now).total_seconds()
+
+
+def load_principal(db: Session, user_id: int, session_id: int) -> AuthenticatedUser:
+    """
+    Load the user and their device session in one query and check both are usable.
+    """
+    row = (
+        db.query(User, DeviceSession)
+        .outerjoin(
+            DeviceSession,
+            (DeviceSession.user_id == User.id) & (DeviceSession.id == session_id)
+        )
+        .filter(User.id == user_id)
+        .first()
+    )
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    user, session = row
+    if not session or not session.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session is no longer active"
+        )
+
+    return AuthenticatedUser(
+        id=user.id,
+        name=user.name,
+        mobile=user.mobile,
+        email=user.email,
+        is_active=bool(user.is_active),
+        session_id=session.id,
+        session_expires_at=session.expires_at
+    )
+
+
+def _token_claims(credentials: HTTPAuthorizationCredentials) -> Tuple[int, int]:
+    """
+    Decode the bearer token and return its (user_id, session_id) claims.
+    """
+    token = credentials.credentials
+
+    try:
+        payload = security.decode_access_token(token)
+    except HTTPException as e:
+        # Re-raise the HTTPException from decode_access_token
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid or expired access token: {str(e)}"
+        )
+
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token does not contain user info"
+        )
+
+    session_id = payload.get("session_id")
+    if not session_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token does not contain session info"
+        )
+
+    try:
+        return int(user_id), int(session_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid user ID format in token"
+        )
+
+
+def _cache_principal(user: AuthenticatedUser):
+    ttl = PRINCIPAL_CACHE_TTL_SECONDS
+    if user.session_expires_at:
+        ttl = min(ttl, _seconds_until(user.session_expires_at))
+    if ttl > 0:
+        set_principal(user, ttl=ttl)
+
+
+def _check_principal(user: AuthenticatedUser) -> AuthenticatedUser:
+    if user.session_expires_at and _seconds_until(user.session_expires_at) <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session expired"
+        )
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
+
+    return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: Session = Depends(get_db)
+) -> AuthenticatedUser:
+    """
+    Validates JWT token and its device session and returns the current authenticated user.
+    Principals are cached per (user, session), so hot requests make no queries.
+    """
+    user_id, session_id = _token_claims(credentials)
+
+    user = get_principal(user_id, session_id)
+    if user is None:
+        user = load_principal(db, user_id, session_id)
+        _cache_principal(user)
+
+    return _check_principal(user)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> AuthenticatedUser:
+    """
+    get_current_user for the async routes (USE_ASYNC_DB).
+    """
+    user_id, session_id = _token_claims(credentials)
+
+    user = get_principal(user_id, session_id)
+    if user is None:
+        user = await db.run_sync(load_principal, user_id, session_id)
+        _cache_principal(user)
+
+    return _check_principal(user)
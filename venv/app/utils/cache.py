@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache whose entries expire after `ttl` seconds.
+
+    The cache is local to one worker process, so anything stored here may be up
+    to `ttl` seconds stale for other workers.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._store: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # key -> [version, loads in flight], only kept while get_or_set is loading the key
+        self._loads: Dict[Hashable, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                # expired
+                del self._store[key]
+                return default
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._bump(key)
+            self._put(key, value, ttl)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Read-through helper: return the cached value or load, store and return it.
+
+        If the key is set or deleted while the loader runs, the loaded value is
+        returned but not stored, since it may predate that change.
+        """
+        _missing = object()
+        value = self.get(key, _missing)
+        if value is not _missing:
+            return value
+
+        with self._lock:
+            load = self._loads.setdefault(key, [0, 0])
+            load[1] += 1
+            version = load[0]
+
+        stored = False
+        try:
+            value = loader()
+            stored = True
+            return value
+        finally:
+            with self._lock:
+                load = self._loads[key]
+                load[1] -= 1
+                if stored and load[0] == version:
+                    self._put(key, value, None)
+                if load[1] == 0:
+                    del self._loads[key]
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._bump(key)
+            self._store.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]):
+        """
+        Drop every entry whose key matches `predicate`.
+        """
+        with self._lock:
+            for key in [k for k in self._loads if predicate(k)]:
+                self._bump(key)
+            for key in [k for k in self._store if predicate(k)]:
+                del self._store[key]
+
+    def clear(self):
+        with self._lock:
+            for key in self._loads:
+                self._bump(key)
+            self._store.clear()
+
+    def _bump(self, key: Hashable):
+        # Invalidate loads of `key` that are in flight; caller holds the lock
+        load = self._loads.get(key)
+        if load is not None:
+            load[0] += 1
+
+    def _put(self, key: Hashable, value: Any, ttl: Optional[float]):
+        # Caller holds the lock
+        self._store[key] = (value, time.monotonic() + (ttl if ttl is not None else self.ttl))
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_size:
+            # evict least recently used
+            self._store.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._store)
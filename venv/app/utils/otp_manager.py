@@ -0,0 +1,109 @@
+import json
+import math
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+import os
+
+from app.utils.otp_store import OTPStore, build_otp_store
+
+# Load .env file
+load_dotenv()
+
+# Read OTP-related environment variables
+OTP_EXPIRY_SECONDS = int(os.getenv("OTP_EXPIRY_SECONDS", 300))
+OTP_MAX_REQUESTS_PER_HOUR = int(os.getenv("OTP_MAX_REQUESTS_PER_HOUR", 5))
+OTP_RATE_WINDOW_SECONDS = 3600
+
+# single instance, backend chosen by OTP_STORE_BACKEND (memory / sqlite / redis)
+_store: OTPStore = build_otp_store()
+
+
+def _otp_key(country_code: str, mobile: str) -> str:
+    return f"otp:{country_code}:{mobile}"
+
+
+def _otp_req_key(country_code: str, mobile: str) -> str:
+    return f"otp_req:{country_code}:{mobile}"
+
+
+def generate_otp(length: int = 6) -> str:
+    # numeric OTP
+    return "".join(secrets.choice("0123456789") for _ in range(length))
+
+
+def store_otp(country_code: str, mobile: str, otp: str, expires_in: int = None, log_id: Optional[int] = None):
+    """
+    Store the OTP together with the id of its "sent" OTPLog row,
+    so verification can update that row without looking it up.
+    """
+    key = _otp_key(country_code, mobile)
+    ex = expires_in or OTP_EXPIRY_SECONDS
+    entry = {"otp": otp, "log_id": log_id, "expires_at": time.time() + ex}
+    _store.set(key, json.dumps(entry), ex=ex)
+
+
+def _parse_entry(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    if raw is None:
+        return None
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        entry = None
+    if not isinstance(entry, dict) or "otp" not in entry:
+        # plain OTP stored before log ids were kept alongside it
+        return {"otp": raw, "log_id": None}
+    return entry
+
+
+def get_otp_entry(country_code: str, mobile: str) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Returns (otp, log_id). Both are None when the OTP expired or was never sent.
+    """
+    entry = _parse_entry(_store.get(_otp_key(country_code, mobile)))
+    if entry is None:
+        return None, None
+    return entry["otp"], entry.get("log_id")
+
+
+def take_otp_entry(country_code: str, mobile: str) -> Optional[Dict[str, Any]]:
+    """
+    Atomically remove the stored OTP and return its entry ({"otp", "log_id", ...}),
+    so that concurrent verifications cannot both use it. None when missing or expired.
+    """
+    return _parse_entry(_store.take(_otp_key(country_code, mobile)))
+
+
+def restore_otp_entry(country_code: str, mobile: str, entry: Dict[str, Any]):
+    """
+    Put back an entry returned by take_otp_entry (e.g. when the login failed)
+    for the rest of its original lifetime.
+    """
+    expires_at = entry.get("expires_at")
+    ex = math.ceil(expires_at - time.time()) if expires_at else OTP_EXPIRY_SECONDS
+    if ex > 0:
+        _store.set(_otp_key(country_code, mobile), json.dumps(entry), ex=ex)
+
+
+def get_otp(country_code: str, mobile: str) -> Optional[str]:
+    return get_otp_entry(country_code, mobile)[0]
+
+
+def delete_otp(country_code: str, mobile: str):
+    _store.delete(_otp_key(country_code, mobile))
+
+
+def can_request_otp(country_code: str, mobile: str) -> bool:
+    """
+    Rate limiting per-hour with a sliding window.
+    The check and the increment happen atomically in the store.
+    """
+    req_key = _otp_req_key(country_code, mobile)
+    return _store.hit(req_key, OTP_MAX_REQUESTS_PER_HOUR, OTP_RATE_WINDOW_SECONDS)
+
+
+def get_remaining_requests(country_code: str, mobile: str) -> int:
+    req_key = _otp_req_key(country_code, mobile)
+    cnt = _store.count(req_key, OTP_RATE_WINDOW_SECONDS)
+    return max(0, OTP_MAX_REQUESTS_PER_HOUR - cnt)
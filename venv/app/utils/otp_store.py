@@ -0,0 +1,344 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+# Load .env file
+load_dotenv()
+
+# Storage backend: memory (single process), sqlite (shared file, multi-worker) or redis
+OTP_STORE_BACKEND = os.getenv("OTP_STORE_BACKEND", "memory")
+OTP_STORE_SQLITE_PATH = os.getenv(
+    "OTP_STORE_SQLITE_PATH", os.path.join(tempfile.gettempdir(), "nucleotide_otp.sqlite3")
+)
+OTP_STORE_REDIS_URL = os.getenv("OTP_STORE_REDIS_URL", "redis://localhost:6379/0")
+OTP_STORE_SWEEP_INTERVAL_SECONDS = float(os.getenv("OTP_STORE_SWEEP_INTERVAL_SECONDS", 30))
+
+
+class OTPStore(ABC):
+    """
+    Key/value storage with expiry plus a sliding-window rate limiter,
+    used by otp_manager for OTPs and per-number request limits.
+    """
+
+    @abstractmethod
+    def set(self, key: str, value: str, ex: Optional[int] = None):
+        """Store `value`, expiring after `ex` seconds (never when None)."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the value, or None if missing or expired."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove the key if present."""
+
+    @abstractmethod
+    def take(self, key: str) -> Optional[str]:
+        """
+        Atomically return and remove the value, or None if missing or expired.
+        Of several concurrent callers at most one gets the value.
+        """
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        """
+        Atomically record one request for `key` if fewer than `limit` requests
+        were recorded in the last `window` seconds. Returns False when over the limit.
+        """
+
+    @abstractmethod
+    def count(self, key: str, window: float) -> int:
+        """Number of requests recorded for `key` in the last `window` seconds."""
+
+    def close(self):
+        """Release resources held by the backend."""
+
+
+class MemoryOTPStore(OTPStore):
+    """
+    In-process store. Keys are spread over `stripes` independent locks and a
+    background thread removes expired keys every `sweep_interval` seconds.
+    Not shared between worker processes.
+    """
+
+    def __init__(self, stripes: int = 16, sweep_interval: float = OTP_STORE_SWEEP_INTERVAL_SECONDS):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # key -> (value, expires_at)
+        self._values: List[Dict[str, Tuple[str, Optional[float]]]] = [{} for _ in range(stripes)]
+        # key -> (request timestamps, window)
+        self._hits: List[Dict[str, Tuple[Deque[float], float]]] = [{} for _ in range(stripes)]
+        self._stop = threading.Event()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop, args=(sweep_interval,), name="otp-store-sweeper", daemon=True
+        )
+        self._sweeper.start()
+
+    def _stripe(self, key: str) -> int:
+        return hash(key) % len(self._locks)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None):
+        i = self._stripe(key)
+        with self._locks[i]:
+            self._values[i][key] = (value, time.time() + ex if ex else None)
+
+    def get(self, key: str) -> Optional[str]:
+        i = self._stripe(key)
+        with self._locks[i]:
+            entry = self._values[i].get(key)
+            if not entry:
+                return None
+            value, expires_at = entry
+            if expires_at and time.time() > expires_at:
+                # expired
+                del self._values[i][key]
+                return None
+            return value
+
+    def delete(self, key: str):
+        i = self._stripe(key)
+        with self._locks[i]:
+            self._values[i].pop(key, None)
+
+    def take(self, key: str) -> Optional[str]:
+        i = self._stripe(key)
+        with self._locks[i]:
+            entry = self._values[i].pop(key, None)
+        if not entry:
+            return None
+        value, expires_at = entry
+        if expires_at and time.time() > expires_at:
+            return None
+        return value
+
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        i = self._stripe(key)
+        now = time.time()
+        with self._locks[i]:
+            timestamps, _ = self._hits[i].setdefault(key, (deque(), window))
+            while timestamps and timestamps[0] <= now - window:
+                timestamps.popleft()
+            if len(timestamps) >= limit:
+                return False
+            timestamps.append(now)
+            self._hits[i][key] = (timestamps, window)
+            return True
+
+    def count(self, key: str, window: float) -> int:
+        i = self._stripe(key)
+        cutoff = time.time() - window
+        with self._locks[i]:
+            entry = self._hits[i].get(key)
+            if not entry:
+                return 0
+            return sum(1 for ts in entry[0] if ts > cutoff)
+
+    def sweep(self):
+        """
+        Remove expired keys and request windows with no recent requests.
+        """
+        for i, lock in enumerate(self._locks):
+            now = time.time()
+            with lock:
+                values = self._values[i]
+                for key in [k for k, (_, exp) in values.items() if exp and now > exp]:
+                    del values[key]
+
+                hits = self._hits[i]
+                for key in [k for k, (ts, window) in hits.items() if not ts or ts[-1] <= now - window]:
+                    del hits[key]
+
+    def _sweep_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            self.sweep()
+
+    def close(self):
+        self._stop.set()
+
+
+class SQLiteOTPStore(OTPStore):
+    """
+    Store backed by a SQLite file, shared by every worker process on the host.
+    Rate-limit checks run inside BEGIN IMMEDIATE so they are atomic across processes.
+    """
+
+    def __init__(self, path: str = OTP_STORE_SQLITE_PATH, sweep_interval: float = OTP_STORE_SWEEP_INTERVAL_SECONDS):
+        self.path = path
+        self.sweep_interval = sweep_interval
+        self._local = threading.local()
+        self._last_sweep = 0.0
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS otp_kv ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS otp_hits ("
+            "key TEXT NOT NULL, ts REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_otp_hits_key_ts ON otp_hits (key, ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_otp_hits_expires_at ON otp_hits (expires_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _maybe_sweep(self, conn: sqlite3.Connection, now: float):
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        conn.execute("DELETE FROM otp_kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        conn.execute("DELETE FROM otp_hits WHERE expires_at <= ?", (now,))
+
+    def set(self, key: str, value: str, ex: Optional[int] = None):
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO otp_kv (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, now + ex if ex else None)
+        )
+        self._maybe_sweep(conn, now)
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._conn().execute(
+            "SELECT value FROM otp_kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, key: str):
+        self._conn().execute("DELETE FROM otp_kv WHERE key = ?", (key,))
+
+    def take(self, key: str) -> Optional[str]:
+        # DELETE ... RETURNING needs SQLite 3.35+
+        row = self._conn().execute(
+            "DELETE FROM otp_kv WHERE key = ? RETURNING value, expires_at", (key,)
+        ).fetchone()
+        if not row:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM otp_hits WHERE key = ? AND ts <= ?", (key, now - window))
+            (count,) = conn.execute("SELECT COUNT(*) FROM otp_hits WHERE key = ?", (key,)).fetchone()
+            allowed = count < limit
+            if allowed:
+                conn.execute(
+                    "INSERT INTO otp_hits (key, ts, expires_at) VALUES (?, ?, ?)",
+                    (key, now, now + window)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._maybe_sweep(conn, now)
+        return allowed
+
+    def count(self, key: str, window: float) -> int:
+        (count,) = self._conn().execute(
+            "SELECT COUNT(*) FROM otp_hits WHERE key = ? AND ts > ?",
+            (key, time.time() - window)
+        ).fetchone()
+        return count
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# Sliding window over a sorted set, run server side so check-and-add is atomic
+_REDIS_HIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return 1
+"""
+
+
+class RedisOTPStore(OTPStore):
+    """
+    Store backed by Redis (or anything speaking the Redis protocol).
+    `client` is a redis-py compatible client, e.g. redis.Redis or a fakeredis stand-in.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self._hit_script = client.register_script(_REDIS_HIT_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str = OTP_STORE_REDIS_URL) -> "RedisOTPStore":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("OTP_STORE_BACKEND=redis requires the 'redis' package (pip install redis)")
+        return cls(redis.Redis.from_url(url))
+
+    def set(self, key: str, value: str, ex: Optional[int] = None):
+        self.client.set(key, value, ex=ex)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    def delete(self, key: str):
+        self.client.delete(key)
+
+    def take(self, key: str) -> Optional[str]:
+        # GETDEL needs Redis 6.2+
+        value = self.client.getdel(key)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        member = f"{time.time()}-{uuid.uuid4().hex}"
+        return bool(self._hit_script(keys=[key], args=[time.time(), window, limit, member]))
+
+    def count(self, key: str, window: float) -> int:
+        return int(self.client.zcount(key, time.time() - window, "+inf"))
+
+    def close(self):
+        self.client.close()
+
+
+def build_otp_store(backend: str = OTP_STORE_BACKEND) -> OTPStore:
+    """
+    Create the OTP store selected by OTP_STORE_BACKEND.
+    """
+    backend = backend.lower()
+    if backend == "memory":
+        return MemoryOTPStore()
+    if backend == "sqlite":
+        return SQLiteOTPStore(OTP_STORE_SQLITE_PATH)
+    if backend == "redis":
+        return RedisOTPStore.from_url(OTP_STORE_REDIS_URL)
+    raise ValueError(f"Unknown OTP_STORE_BACKEND: {backend}")
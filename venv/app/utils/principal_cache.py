@@ -0,0 +1,38 @@
+from typing import Optional
+from dotenv import load_dotenv
+import os
+
+from app.schemas.auth import AuthenticatedUser
+from app.utils.cache import TTLCache
+
+load_dotenv()
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", 50000))
+
+# (user_id, session_id) -> AuthenticatedUser
+# Invalidation only reaches the local process, other workers pick up changes
+# once the entry's TTL runs out.
+principal_cache = TTLCache(max_size=PRINCIPAL_CACHE_MAX_SIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def get_principal(user_id: int, session_id: int) -> Optional[AuthenticatedUser]:
+    return principal_cache.get((user_id, session_id))
+
+
+def set_principal(principal: AuthenticatedUser, ttl: Optional[float] = None):
+    principal_cache.set((principal.id, principal.session_id), principal, ttl=ttl)
+
+
+def invalidate_session(user_id: int, session_id: int):
+    """
+    Drop the cached principal for one device session.
+    """
+    principal_cache.delete((user_id, session_id))
+
+
+def invalidate_user(user_id: int):
+    """
+    Drop every cached principal of a user (all of their sessions).
+    """
+    principal_cache.delete_where(lambda key: key[0] == user_id)
@@ -0,0 +1,119 @@
+"""
+Sync vs async route comparison under concurrent load.
+
+Seeds a throwaway SQLite database, then drives the ASGI app in-process with
+`CONCURRENCY` concurrent clients, once with the default threadpool routes and
+once with USE_ASYNC_DB=true (AsyncSession routes). Response caches are
+disabled so every request reaches the database.
+
+    python benchmarks/async_benchmark.py [requests] [concurrency]
+
+Needs httpx and aiosqlite. Point DATABASE_URL at MySQL (with aiomysql
+installed) for numbers that reflect production.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1] != "--child" else 2000
+CONCURRENCY = int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[1] != "--child" else 100
+PRODUCTS = 200
+
+
+def seed():
+    from app.database import Base, SessionLocal, engine
+    from app.crud.auth import create_device_session, create_user
+    from app.models.CartItemModel import CartItem
+    from app.models.ProductModel import Product
+    from app.utils import security
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    db.add_all(
+        Product(Name=f"Product {i}", Price=100.0, SpecialPrice=90.0, ShortDescription="bench")
+        for i in range(PRODUCTS)
+    )
+    user = create_user(db, mobile="9000000000")
+    db.add_all(CartItem(user_id=user.id, product_id=i + 1, quantity=1) for i in range(10))
+    session = create_device_session(db, user_id=user.id, expires_in_seconds=3600)
+    db.commit()
+    token = security.create_access_token({"sub": str(user.id), "session_id": str(session.id)})
+    db.close()
+    return token
+
+
+async def drive(token, requests, concurrency):
+    import httpx
+    from app.database import async_engine
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [
+        f"/products/detail/{i % PRODUCTS + 1}" if i % 2 else "/cart/view"
+        for i in range(requests)
+    ]
+    latencies = []
+    queue = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    async def client_loop(client):
+        while not queue.empty():
+            path = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    # ASGITransport skips lifespan events, so close the async pool here
+    if async_engine is not None:
+        await async_engine.dispose()
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def child(requests, concurrency):
+    sys.path.insert(0, ROOT)
+    token = seed()
+    print(json.dumps(asyncio.run(drive(token, requests, concurrency))))
+
+
+def main():
+    print(f"{REQUESTS} requests, {CONCURRENCY} concurrent clients")
+    for mode in ("sync", "async"):
+        env = dict(
+            os.environ,
+            USE_ASYNC_DB="true" if mode == "async" else "false",
+            PRODUCT_CACHE_TTL_SECONDS="0",
+            CART_CACHE_TTL_SECONDS="0",
+        )
+        env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", str(REQUESTS), str(CONCURRENCY)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(out)
+        print(f"{mode:>6}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,95 @@
+"""
+Cart view benchmark: query count and latency against cart size.
+
+Compares the old lazy-loading read (one query for the items, then one per
+product), the joined read used by /cart/view and the cached read.
+
+    python benchmarks/cart_view_benchmark.py
+
+Runs against a throwaway SQLite database unless DATABASE_URL is set.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.User import User  # noqa: E402
+from app.models.ProductModel import Product  # noqa: E402
+from app.models.CartItemModel import CartItem  # noqa: E402
+from app.crud.cart import build_cart_view, get_cart_view, invalidate_cart  # noqa: E402
+
+CART_SIZES = [1, 10, 50, 200]
+ROUNDS = 50
+
+engine.echo = False
+Base.metadata.create_all(bind=engine)
+
+query_count = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    global query_count
+    query_count += 1
+
+
+def legacy_view(db, user_id):
+    # The pre-join implementation: item.product is lazy loaded per line
+    subtotal = 0
+    for item in db.query(CartItem).filter(CartItem.user_id == user_id).all():
+        subtotal += item.quantity * item.product.SpecialPrice
+    return subtotal
+
+
+def seed(db, size):
+    user = User(mobile=f"bench-{size}-{time.time_ns()}")
+    db.add(user)
+    db.flush()
+    products = [
+        Product(Name=f"Product {i}", Price=100.0, SpecialPrice=90.0, ShortDescription="bench")
+        for i in range(size)
+    ]
+    db.add_all(products)
+    db.flush()
+    db.add_all(CartItem(user_id=user.id, product_id=p.ProductId, quantity=2) for p in products)
+    db.commit()
+    return user.id
+
+
+def measure(fn, user_id):
+    global query_count
+    total = 0.0
+    queries = 0
+    for _ in range(ROUNDS):
+        db = SessionLocal()
+        query_count = 0
+        start = time.perf_counter()
+        fn(db, user_id)
+        total += time.perf_counter() - start
+        queries = query_count
+        db.close()
+    return queries, total / ROUNDS * 1000
+
+
+def main():
+    db = SessionLocal()
+    print(f"{'items':>6} | {'lazy q':>6} {'lazy ms':>8} | {'join q':>6} {'join ms':>8} | {'cache q':>7} {'cache ms':>8}")
+    for size in CART_SIZES:
+        user_id = seed(db, size)
+        lazy_q, lazy_ms = measure(legacy_view, user_id)
+        join_q, join_ms = measure(build_cart_view, user_id)
+        invalidate_cart(user_id)
+        get_cart_view(db, user_id)
+        cache_q, cache_ms = measure(get_cart_view, user_id)
+        print(f"{size:>6} | {lazy_q:>6} {lazy_ms:>8.3f} | {join_q:>6} {join_ms:>8.3f} | {cache_q:>7} {cache_ms:>8.3f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+verify-otp login benchmark: statements per login and logins per second.
+
+"before" replays the old verify-otp chain (mark_verified, latest sent log
+lookup, get_user_by_mobile, create_user, create_device_session, each with
+its own commit). "after" is crud.auth.login_with_verified_otp.
+
+    python benchmarks/login_benchmark.py [logins] [threads]
+
+Runs against a throwaway SQLite database unless DATABASE_URL is set.
+Half of the logins are for new users, half for returning ones.
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.crud import otp_log  # noqa: E402
+from app.crud.auth import (  # noqa: E402
+    create_device_session,
+    create_user,
+    get_user_by_mobile,
+    login_with_verified_otp,
+)
+from app.utils.security import hash_value  # noqa: E402
+
+LOGINS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+THREADS = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+engine.echo = False
+Base.metadata.create_all(bind=engine)
+
+statement_count = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    global statement_count
+    statement_count += 1
+
+
+def legacy_login(db, mobile, phone_number, otp_hash, sent_log_id):
+    last_sent = (
+        db.query(otp_log.OTPLog)
+        .filter(otp_log.OTPLog.phone_number == phone_number, otp_log.OTPLog.status == "sent")
+        .order_by(otp_log.OTPLog.generated_at.desc())
+        .first()
+    )
+    if last_sent:
+        otp_log.mark_verified(db=db, log_id=last_sent.id, user_entered_otp_hash=otp_hash)
+    user = get_user_by_mobile(db, mobile)
+    if not user:
+        user = create_user(db, mobile=mobile)
+    session = create_device_session(db=db, user_id=user.id, device_platform="web", expires_in_seconds=86400)
+    return user.id, session.id
+
+
+def new_login(db, mobile, phone_number, otp_hash, sent_log_id):
+    principal = login_with_verified_otp(
+        db=db,
+        mobile=mobile,
+        phone_number=phone_number,
+        sent_log_id=sent_log_id,
+        user_entered_otp_hash=otp_hash,
+        device_platform="web",
+        expires_in_seconds=86400
+    )
+    return principal.id, principal.session_id
+
+
+def run(label, login_fn):
+    global statement_count
+    otp_hash = hash_value("123456")
+
+    # Sent logs are created up front, as /auth/send-otp would have done
+    db = SessionLocal()
+    jobs = []
+    for i in range(LOGINS):
+        mobile = f"{label}-{i % (LOGINS // 2 or 1)}"
+        log = otp_log.create_sent_log(db, phone_number=f"+91{mobile}", otp_hash=otp_hash)
+        jobs.append((mobile, f"+91{mobile}", log.id))
+    db.close()
+
+    def login(job):
+        session = SessionLocal()
+        try:
+            login_fn(session, job[0], job[1], otp_hash, job[2])
+        finally:
+            session.close()
+
+    statement_count = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        list(pool.map(login, jobs))
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:>6}: {LOGINS / elapsed:8.1f} logins/s  {statement_count / LOGINS:5.1f} statements/login")
+
+
+def main():
+    print(f"{LOGINS} logins, {THREADS} thread(s), {engine.url.get_backend_name()}")
+    run("before", legacy_login)
+    run("after", new_login)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before anything imports app.database
+_DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ["AUDIT_SYNC_MODE"] = "true"
+os.environ["OTP_STORE_BACKEND"] = "memory"
+
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.database import Base, SessionLocal, engine, get_async_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.crud.auth import create_device_session, create_user  # noqa: E402
+from app.crud.cart import cart_cache  # noqa: E402
+from app.models.ProductModel import Product  # noqa: E402
+from app.routers import auth as auth_router, cart_router, product_router  # noqa: E402
+from app.routers.product_router import product_detail_cache, product_list_cache  # noqa: E402
+from app.utils import security  # noqa: E402
+from app.utils.principal_cache import principal_cache  # noqa: E402
+
+TEST_DATABASE_PATH = _DB_PATH
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    for cache in (cart_cache, product_list_cache, product_detail_cache, principal_cache):
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def async_client():
+    """
+    Client for the async routers (as mounted with USE_ASYNC_DB=true), backed by
+    an aiosqlite engine on the test database.
+    """
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DATABASE_PATH}")
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_test_async_db():
+        async with session_factory() as session:
+            yield session
+
+    async_app = FastAPI()
+    for module in (product_router, cart_router, auth_router):
+        async_app.include_router(module.async_router)
+    async_app.dependency_overrides[get_async_db] = get_test_async_db
+
+    with TestClient(async_app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+
+@pytest.fixture
+def user(db):
+    return create_user(db, mobile="9000000000", name="Test User")
+
+
+@pytest.fixture
+def auth_headers(db, user):
+    session = create_device_session(db, user_id=user.id, expires_in_seconds=3600)
+    token = security.create_access_token({"sub": str(user.id), "session_id": str(session.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def products(db):
+    items = [
+        Product(Name=f"Product {i}", Price=100.0, SpecialPrice=90.0, ShortDescription="test")
+        for i in range(3)
+    ]
+    db.add_all(items)
+    db.commit()
+    return [product.ProductId for product in items]
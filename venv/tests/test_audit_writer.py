@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+from app.database import SessionLocal
+from app.models.AuditLog import AuditLog
+from app.utils.audit_writer import AuditWriter
+
+
+def _audit_values():
+    return {"user_id": 1, "action": "VIEW", "entity_type": "CART"}
+
+
+def test_sync_mode_writes_inline_outside_an_event_loop():
+    writer = AuditWriter(SessionLocal, sync=True)
+    written = []
+    writer._write = lambda batch: written.append(threading.get_ident())
+
+    writer.submit(AuditLog, _audit_values())
+
+    assert written == [threading.get_ident()]
+
+
+def test_submit_does_not_write_on_the_event_loop_thread():
+    writer = AuditWriter(SessionLocal, sync=True)
+    written = []
+    writer._write = lambda batch: written.append(threading.get_ident())
+
+    async def submit_from_loop():
+        writer.submit(AuditLog, _audit_values())
+        await asyncio.sleep(0.2)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(submit_from_loop())
+
+    assert len(written) == 1
+    assert written[0] != loop_thread
+
+
+def test_full_queue_does_not_block_the_event_loop():
+    writer = AuditWriter(SessionLocal, max_queue_size=1, enqueue_timeout=5.0, sync=False)
+    # A worker that never drains the queue
+    writer.start = lambda: None
+    writer._thread = object()
+    written = []
+    writer._write = lambda batch: written.append(threading.get_ident())
+    writer.submit(AuditLog, _audit_values())
+
+    async def submit_from_loop():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        writer.submit(AuditLog, _audit_values())
+        elapsed = loop.time() - start
+        await asyncio.sleep(0.2)
+        return elapsed
+
+    assert asyncio.run(submit_from_loop()) < 1.0
+    assert len(written) == 1
@@ -0,0 +1,90 @@
+from app.crud import auth as auth_crud
+
+
+def test_upsert_user_by_mobile_returns_concurrently_created_user(db, monkeypatch):
+    existing = auth_crud.create_user(db, mobile="9111111111")
+
+    # Simulate a snapshot taken before the other login committed its user
+    monkeypatch.setattr(auth_crud, "get_user_by_mobile", lambda db, mobile: None)
+
+    user = auth_crud.upsert_user_by_mobile(db, "9111111111")
+    assert user is not None
+    assert user.id == existing.id
+
+
+def _send_otp(client, mobile):
+    response = client.post("/auth/send-otp", json={"country_code": "+91", "mobile": mobile})
+    assert response.status_code == 200
+    return response.json()["data"]["otp"]
+
+
+def _verify_otp(client, mobile, otp):
+    return client.post("/auth/verify-otp", json={
+        "country_code": "+91",
+        "mobile": mobile,
+        "otp": otp,
+        "device_id": "test-device",
+        "device_platform": "web"
+    })
+
+
+def test_otp_cannot_be_used_twice(client):
+    otp = _send_otp(client, "9222222222")
+
+    assert _verify_otp(client, "9222222222", otp).status_code == 200
+    assert _verify_otp(client, "9222222222", otp).status_code == 400
+
+
+def test_wrong_otp_keeps_the_sent_otp(client):
+    otp = _send_otp(client, "9333333333")
+    wrong = "000000" if otp != "000000" else "111111"
+
+    assert _verify_otp(client, "9333333333", wrong).status_code == 400
+    assert _verify_otp(client, "9333333333", otp).status_code == 200
+
+
+def test_failed_login_restores_the_otp(client, monkeypatch):
+    from app.routers import auth as auth_router
+    otp = _send_otp(client, "9444444444")
+
+    def failing_login(**kwargs):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(auth_router, "login_with_verified_otp", failing_login)
+    failing_client = type(client)(client.app, raise_server_exceptions=False)
+    assert _verify_otp(failing_client, "9444444444", otp).status_code == 500
+
+    monkeypatch.undo()
+    assert _verify_otp(client, "9444444444", otp).status_code == 200
+
+
+def _on_event_loop_thread() -> bool:
+    import asyncio
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def test_async_routes_call_the_otp_store_off_the_event_loop(async_client, monkeypatch):
+    from app.utils import otp_manager
+    store = otp_manager._store
+    calls = []
+
+    class RecordingStore:
+        def __getattr__(self, name):
+            method = getattr(store, name)
+
+            def record(*args, **kwargs):
+                calls.append((name, _on_event_loop_thread()))
+                return method(*args, **kwargs)
+            return record
+
+    monkeypatch.setattr(otp_manager, "_store", RecordingStore())
+
+    otp = _send_otp(async_client, "9555555555")
+    assert _verify_otp(async_client, "9555555555", otp).status_code == 200
+
+    assert {name for name, _ in calls} >= {"hit", "set", "get", "take"}
+    assert not any(on_loop for _, on_loop in calls)
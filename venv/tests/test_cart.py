@@ -0,0 +1,121 @@
+import pytest
+
+
+@pytest.fixture(params=["sync", "async"])
+def cart_client(request, client):
+    if request.param == "sync":
+        return client
+    return request.getfixturevalue("async_client")
+
+
+def test_update_returns_and_caches_new_quantity(cart_client, auth_headers, products):
+    added = cart_client.post("/cart/add", json={"product_id": products[0], "quantity": 2}, headers=auth_headers)
+    cart_item_id = added.json()["data"]["cart_item_id"]
+
+    updated = cart_client.put(f"/cart/update/{cart_item_id}", json={"quantity": 9}, headers=auth_headers)
+    assert updated.status_code == 200
+    assert updated.json()["data"]["quantity"] == 9
+
+    view = cart_client.get("/cart/view", headers=auth_headers).json()["data"]
+    assert [line["quantity"] for line in view["cart_items"]] == [9]
+
+
+def test_add_zero_quantity_is_rejected(client, auth_headers, products):
+    response = client.post(
+        "/cart/bulk",
+        json={"operations": [{"op": "add", "product_id": products[0], "quantity": 0}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    view = client.get("/cart/view", headers=auth_headers).json()["data"]
+    assert view["cart_items"] == []
+
+
+@pytest.mark.parametrize("operation", [{"op": "remove"}, {"op": "set", "quantity": 0}])
+def test_removing_unknown_product_is_a_no_op(client, auth_headers, operation):
+    response = client.post(
+        "/cart/bulk",
+        json={"operations": [dict(operation, product_id=12345)]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["cart_items"] == []
+
+
+def _cart_item_audit(db):
+    from app.models.AuditLog import AuditLog
+    logs = db.query(AuditLog).filter(AuditLog.entity_type == "CART_ITEM").order_by(AuditLog.id).all()
+    return [(log.action, log.details) for log in logs]
+
+
+def test_audit_records_previous_quantities(client, db, auth_headers, products):
+    product_id = products[0]
+    added = client.post("/cart/add", json={"product_id": product_id, "quantity": 2}, headers=auth_headers)
+    cart_item_id = added.json()["data"]["cart_item_id"]
+    client.post("/cart/add", json={"product_id": product_id, "quantity": 3}, headers=auth_headers)
+    client.put(f"/cart/update/{cart_item_id}", json={"quantity": 7}, headers=auth_headers)
+    client.delete(f"/cart/delete/{cart_item_id}", headers=auth_headers)
+
+    assert _cart_item_audit(db) == [
+        ("ADD", {"product_id": product_id, "quantity": 2}),
+        ("UPDATE", {"product_id": product_id, "old_quantity": 2, "new_quantity": 5, "quantity_added": 3}),
+        ("UPDATE", {"product_id": product_id, "old_quantity": 5, "new_quantity": 7}),
+        ("DELETE", {"product_id": product_id, "quantity": 7}),
+    ]
+
+
+def test_cart_writes_without_dialect_upsert(client, auth_headers, products, monkeypatch):
+    from app.crud import cart as cart_crud
+    monkeypatch.setattr(cart_crud, "UPSERT_STATEMENTS", {})
+
+    operations = [
+        {"op": "add", "product_id": products[0], "quantity": 2},
+        {"op": "add", "product_id": products[1], "quantity": 1},
+    ]
+    client.post("/cart/bulk", json={"operations": operations}, headers=auth_headers)
+    response = client.post(
+        "/cart/bulk",
+        json={"operations": [
+            {"op": "add", "product_id": products[0], "quantity": 3},
+            {"op": "set", "product_id": products[1], "quantity": 4},
+            {"op": "add", "product_id": products[2], "quantity": 1},
+        ]},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    quantities = {line["product_id"]: line["quantity"] for line in response.json()["data"]["cart_items"]}
+    assert quantities == {products[0]: 5, products[1]: 4, products[2]: 1}
+
+
+def test_cart_view_reflects_changes_after_it_was_cached(client, auth_headers, products):
+    client.post("/cart/add", json={"product_id": products[0], "quantity": 1}, headers=auth_headers)
+    assert len(client.get("/cart/view", headers=auth_headers).json()["data"]["cart_items"]) == 1
+
+    client.post("/cart/add", json={"product_id": products[1], "quantity": 1}, headers=auth_headers)
+    assert len(client.get("/cart/view", headers=auth_headers).json()["data"]["cart_items"]) == 2
+
+    client.delete("/cart/clear", headers=auth_headers)
+    assert client.get("/cart/view", headers=auth_headers).json()["data"]["cart_items"] == []
+
+
+def test_cart_view_started_before_a_change_is_not_cached(client, db, auth_headers, products, user, monkeypatch):
+    from app.crud import cart as cart_crud
+    client.post("/cart/add", json={"product_id": products[0], "quantity": 1}, headers=auth_headers)
+    cart_crud.invalidate_cart(user.id)
+
+    build_cart_view = cart_crud.build_cart_view
+
+    def build_then_change(db, user_id):
+        view = build_cart_view(db, user_id)
+        db.rollback()  # release the SQLite read lock
+        # another request changes the cart before this view is stored
+        client.post("/cart/add", json={"product_id": products[1], "quantity": 1}, headers=auth_headers)
+        return view
+
+    monkeypatch.setattr(cart_crud, "build_cart_view", build_then_change)
+    cart_crud.get_cart_view(db, user.id)
+    monkeypatch.undo()
+
+    assert len(client.get("/cart/view", headers=auth_headers).json()["data"]["cart_items"]) == 2
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from app.utils.otp_store import MemoryOTPStore, RedisOTPStore, SQLiteOTPStore
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryOTPStore()
+    elif request.param == "sqlite":
+        backend = SQLiteOTPStore(str(tmp_path / "otp.sqlite3"))
+    else:
+        # Lua scripting in fakeredis needs the fakeredis[lua] extra
+        fakeredis = pytest.importorskip("fakeredis")
+        backend = RedisOTPStore(fakeredis.FakeRedis())
+    yield backend
+    backend.close()
+
+
+def _run_concurrently(target, threads):
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        target()
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+def test_take_returns_and_removes_value(store):
+    store.set("otp:+91:1", "123456", ex=60)
+
+    assert store.take("otp:+91:1") == "123456"
+    assert store.take("otp:+91:1") is None
+    assert store.get("otp:+91:1") is None
+
+
+def test_take_is_exclusive_under_concurrency(store):
+    store.set("otp:+91:2", "123456", ex=60)
+    taken = []
+
+    _run_concurrently(lambda: taken.append(store.take("otp:+91:2")), threads=16)
+
+    assert [value for value in taken if value is not None] == ["123456"]